@@ -0,0 +1,6 @@
+"""Repeatable benchmarks for the solver, game logic and board rendering.
+
+Run ``python -m benchmarks run --save baseline.json`` once, then
+``python -m benchmarks run --compare baseline.json`` after a change; the
+comparison exits non-zero when any metric regresses past the threshold.
+"""
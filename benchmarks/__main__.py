@@ -0,0 +1,77 @@
+import argparse
+import json
+import platform
+import sys
+
+from benchmarks.suite import REFERENCE, run_all
+
+# Metrics where a bigger number is worse; rates are derived from these
+REGRESSION_METRICS = ["seconds", "peak_bytes", "ms_per_redraw", "items_created"]
+TIME_METRICS = {"seconds", "ms_per_redraw"}
+
+
+def machine_factor(baseline, current):
+    """Return how much slower this machine ran the reference loop than the baseline did"""
+    try:
+        return current[REFERENCE]["seconds"] / baseline[REFERENCE]["seconds"]
+    except (KeyError, ZeroDivisionError):
+        return 1.0
+
+
+def find_regressions(baseline, current, threshold):
+    """Return (name, metric, old, new) for every metric that got worse by more than threshold
+
+    Timings are scaled by the reference loop first, so a run on a busier or
+    slower machine is not reported as a regression of every benchmark.
+    """
+    factor = machine_factor(baseline, current)
+    regressions = []
+    for name, metrics in current.items():
+        old_metrics = baseline.get(name)
+        if old_metrics is None or name == REFERENCE:
+            continue
+        for metric in REGRESSION_METRICS:
+            if metric not in metrics or metric not in old_metrics:
+                continue
+            old, new = old_metrics[metric], metrics[metric]
+            if metric in TIME_METRICS:
+                new = new / factor
+            if new > old * (1 + threshold) and not (old == 0 and new == 0):
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run the benchmark suite")
+    parser.add_argument("command", choices=["run"])
+    parser.add_argument("--repeats", type=int, default=5, help="runs per benchmark, the best one counts")
+    parser.add_argument("--tk", action="store_true", help="render on a hidden Tk root instead of a stub canvas")
+    parser.add_argument("--save", help="write the results to this baseline file")
+    parser.add_argument("--compare", help="compare against this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.repeats, args.tk)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        print(f"Machine speed factor {machine_factor(baseline, results):.2f} against {args.compare}", file=sys.stderr)
+        regressions = find_regressions(baseline, results, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old:.6g} -> {new:.6g}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
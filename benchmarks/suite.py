@@ -0,0 +1,190 @@
+import time
+import timeit
+import tracemalloc
+from itertools import islice
+
+from board_renderer import BoardRenderer
+from game_logic import GameLogic, CompactGameLogic
+from hanoi_solver import HanoiSolver
+
+SOLVE_SIZES = [10, 14, 18]
+RENDER_SIZES = [3, 8, 16, 64]
+RENDER_MOVES = 4095  # Replay at most this many moves per size
+REFERENCE = "machine.reference"
+
+
+class StubCanvas:
+    """Offscreen stand-in for tkinter.Canvas that counts the items it is asked to create"""
+
+    def __init__(self):
+        self.items_created = 0
+        self.calls = 0
+
+    def create_rectangle(self, *args, **kwargs):
+        self.items_created += 1
+        return self.items_created
+
+    create_text = create_rectangle
+
+    def delete(self, *args):
+        self.calls += 1
+
+    def coords(self, *args):
+        self.calls += 1
+
+    def itemconfigure(self, *args, **kwargs):
+        self.calls += 1
+
+    def tag_raise(self, *args):
+        self.calls += 1
+
+    tag_lower = tag_raise
+
+
+def make_canvas(use_tk):
+    """Return a canvas and a cleanup callback, using a hidden Tk root when asked"""
+    if use_tk:
+        import tkinter
+        root = tkinter.Tk()
+        root.withdraw()
+        return tkinter.Canvas(root, width=700, height=400), root.destroy
+    return StubCanvas(), lambda: None
+
+
+def count_items(canvas):
+    if isinstance(canvas, StubCanvas):
+        return canvas.items_created
+    return len(canvas.find_all())
+
+
+def best_of(repeats, func):
+    """Return the fastest seconds per call of func over repeats samples.
+
+    Like timeit's autorange, each sample loops func until it has run for at
+    least 0.2 seconds, so sub-millisecond benchmarks are timed over
+    many calls instead of one and stay steady enough to compare.
+    """
+    timer = timeit.Timer(func, timer=time.perf_counter)
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+
+def peak_allocation(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def reference_loop():
+    """Fixed pure-Python workload used to gauge how fast the machine is right now"""
+    counts = {}
+    for i in range(20000):
+        key = i % 97
+        counts[key] = counts.get(key, 0) + i
+    return counts
+
+
+def bench_reference(repeats):
+    return best_of(repeats, reference_loop)
+
+
+def bench_solver(repeats):
+    solver = HanoiSolver(None)
+    results = {}
+    for n in SOLVE_SIZES:
+        moves = (1 << n) - 1
+        seconds = best_of(repeats, lambda: solver.solve(n))
+        results[f"solver.solve.n{n}"] = {
+            "seconds": seconds,
+            "moves_per_sec": moves / seconds,
+            "peak_bytes": peak_allocation(lambda: solver.solve(n)),
+        }
+
+        def drain():
+            for _ in solver.iter_moves(n):
+                pass
+        seconds = best_of(repeats, drain)
+        results[f"solver.iter_moves.n{n}"] = {
+            "seconds": seconds,
+            "moves_per_sec": moves / seconds,
+            "peak_bytes": peak_allocation(drain),
+        }
+    return results
+
+
+def bench_game_logic(repeats, num_disks=16):
+    moves = list(HanoiSolver(None).iter_moves(num_disks))
+    results = {}
+    for name, backend in (("list", GameLogic), ("compact", CompactGameLogic)):
+        def apply_moves():
+            game = backend()
+            game.initialize(num_disks)
+            move_disk = game.move_disk
+            for from_peg, to_peg in moves:
+                move_disk(from_peg, to_peg)
+        seconds = best_of(repeats, apply_moves)
+        results[f"logic.move_disk.{name}.n{num_disks}"] = {
+            "seconds": seconds,
+            "moves_per_sec": len(moves) / seconds,
+        }
+
+        game = backend()
+        game.initialize(num_disks)
+        calls = 100000
+
+        def check_solved():
+            is_solved = game.is_solved
+            for _ in range(calls):
+                is_solved()
+        seconds = best_of(repeats, check_solved)
+        results[f"logic.is_solved.{name}.n{num_disks}"] = {
+            "seconds": seconds,
+            "calls_per_sec": calls / seconds,
+        }
+    return results
+
+
+def bench_rendering(repeats, use_tk=False):
+    results = {}
+    for n in RENDER_SIZES:
+        game = GameLogic()
+        game.initialize(n)
+        moves = list(islice(HanoiSolver(game).iter_moves(n), RENDER_MOVES))
+        canvas, cleanup = make_canvas(use_tk)
+        try:
+            renderer = BoardRenderer(canvas, 3, n)
+            renderer.draw_board()
+            renderer.sync(game.pegs)
+            initial_items = count_items(canvas)
+
+            def replay():
+                game.initialize(n)
+                renderer.sync(game.pegs)
+                for from_peg, to_peg in moves:
+                    game.move_disk(from_peg, to_peg)
+                    renderer.sync(game.pegs)
+            seconds = best_of(repeats, replay)
+            results[f"render.sync.n{n}"] = {
+                "ms_per_redraw": seconds * 1000 / (len(moves) + 1),
+                "items_created": count_items(canvas) - initial_items,
+                "initial_items": initial_items,
+            }
+        finally:
+            cleanup()
+    return results
+
+
+def run_all(repeats=5, use_tk=False):
+    # The reference is timed on both sides of the suite so a compare can
+    # scale out machine-wide drift that affects every benchmark alike
+    reference = bench_reference(repeats)
+    results = {}
+    results.update(bench_solver(repeats))
+    results.update(bench_game_logic(repeats))
+    results.update(bench_rendering(repeats, use_tk))
+    reference = min(reference, bench_reference(repeats))
+    results[REFERENCE] = {"seconds": reference}
+    return results
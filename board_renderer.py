@@ -0,0 +1,273 @@
+from functools import lru_cache
+
+# Modern 2D color palette
+DISK_COLORS = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7", "#DDA0DD", "#98D8C8", "#F7DC6F"]
+DEFAULT_WIDTH = 700
+DEFAULT_HEIGHT = 400
+MAX_DISK_HEIGHT = 28
+LOD_DISK_HEIGHT = 16  # Below this disks are drawn as plain bars without outline or number
+
+
+@lru_cache(maxsize=None)
+def lighten_color(color, factor):
+    """Lighten a hex color by factor (0-1)"""
+    r = int(color[1:3], 16)
+    g = int(color[3:5], 16)
+    b = int(color[5:7], 16)
+    r = min(255, int(r + (255 - r) * factor))
+    g = min(255, int(g + (255 - g) * factor))
+    b = min(255, int(b + (255 - b) * factor))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+class BoardLayout:
+    """Board geometry derived from the canvas size, peg count and disk count.
+
+    At the default 700x400 canvas with three pegs and up to eight disks this
+    reproduces the classic fixed layout; otherwise pegs spread across the width
+    and disks shrink to fit, switching to thin bars once they get too small.
+    """
+
+    def __init__(self, width, height, num_pegs, num_disks):
+        self.width = width
+        self.height = height
+        spacing = width * 6 / 7 / num_pegs
+        self.peg_positions = [round(width / 2 + (i - (num_pegs - 1) / 2) * spacing) for i in range(num_pegs)]
+        self.peg_top = round(height * 0.15)
+        self.base_y = height - 60
+        self.label_y = height - 25
+        self.lift_y = max(self.peg_top - 30, 5)  # Height disks travel at between pegs
+        self.stack_bottom = self.base_y - 5
+        self.disk_height = min(MAX_DISK_HEIGHT, (self.stack_bottom - self.peg_top - 10) / max(num_disks, 1))
+        self.min_disk_width = min(40, spacing / 4)
+        max_disk_width = spacing - 20
+        self.disk_step = min(20, (max_disk_width - self.min_disk_width) / max(num_disks - 1, 1))
+        self.lod = self.disk_height < LOD_DISK_HEIGHT
+
+    def disk_box(self, disk, peg_idx, level):
+        """Return the (x0, y0, x1, y1) box of a disk sitting at a peg and level"""
+        x = self.peg_positions[peg_idx]
+        width = round(self.min_disk_width + disk * self.disk_step)
+        y_top = round(self.stack_bottom - (level + 1) * self.disk_height)
+        y_bottom = round(self.stack_bottom - level * self.disk_height)
+        return x - width//2, y_top, x + width//2, y_bottom
+
+    def peg_box(self, peg_idx):
+        """Return the box outlining a whole peg, used by the peg overlays"""
+        x = self.peg_positions[peg_idx]
+        return x - 30, self.peg_top - 10, x + 30, self.base_y + 20
+
+
+class BoardRenderer:
+    """Retained-mode canvas renderer: items are created once and moved in place"""
+
+    def __init__(self, canvas, num_pegs=3, num_disks=8):
+        self.canvas = canvas
+        self.num_pegs = num_pegs
+        self.num_disks = num_disks
+        self.layout = BoardLayout(DEFAULT_WIDTH, DEFAULT_HEIGHT, num_pegs, num_disks)
+        self.static_items = []  # (peg, base, label) canvas item ids per peg
+        self.disk_items = {}  # disk -> canvas item ids: (body, highlight, label), or (body,) in LOD mode
+        self.disk_slots = {}  # disk -> (peg, level) the disk is currently drawn at
+        self.selection_item = None
+        self.flash_item = None
+        self.hint_disk_item = None
+        self.hint_peg_item = None
+        self.selected_disk = None  # Disk under the selection overlay, if shown
+        self.hint = None  # (disk, to_peg) under the hint overlays, if shown
+
+    @property
+    def peg_positions(self):
+        return self.layout.peg_positions
+
+    def configure(self, num_pegs, num_disks):
+        """Switch to a new board shape; call draw_board afterwards"""
+        self.num_pegs = num_pegs
+        self.num_disks = num_disks
+        self.layout = BoardLayout(self.layout.width, self.layout.height, num_pegs, num_disks)
+
+    def resize(self, width, height):
+        """Reflow every item for a new canvas size without recreating the board"""
+        if (width, height) == (self.layout.width, self.layout.height):
+            return
+        was_lod = self.layout.lod
+        self.layout = BoardLayout(width, height, self.num_pegs, self.num_disks)
+        if self.layout.lod != was_lod:
+            # Disks are built from different items in each mode
+            for items in self.disk_items.values():
+                for item in items:
+                    self.canvas.delete(item)
+            self.disk_items = {}
+        self.place_static_items()
+        for disk, (peg_idx, level) in list(self.disk_slots.items()):
+            self.place_disk(disk, peg_idx, level)
+        if self.selected_disk is not None:
+            self.show_selection(self.selected_disk)
+        if self.hint is not None:
+            self.show_hint(*self.hint)
+        self.hide_flash()
+
+    def draw_board(self):
+        """Create the static pegs and the hidden overlay items"""
+        self.canvas.delete("all")
+        self.disk_items = {}
+        self.disk_slots = {}
+        self.selected_disk = None
+        self.hint = None
+
+        # Draw clean 2D pegs
+        self.static_items = [self.create_peg_items(i) for i in range(self.num_pegs)]
+        self.place_static_items()
+
+        # Overlays are toggled with their state instead of being redrawn
+        self.selection_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="#00ff88", width=3, fill="",
+                                                           state="hidden")
+        self.flash_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="#ff4444", width=3, fill="",
+                                                       state="hidden")
+        self.hint_disk_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="#ffd700", width=3, fill="",
+                                                           state="hidden")
+        self.hint_peg_item = self.canvas.create_rectangle(0, 0, 0, 0, outline="#ffd700", width=2, dash=(6, 4),
+                                                          fill="", state="hidden")
+
+    def create_peg_items(self, peg_idx):
+        return (
+            # Simple rectangular peg
+            self.canvas.create_rectangle(0, 0, 0, 0, fill="#666666", outline="#999999", width=2),
+            # Base
+            self.canvas.create_rectangle(0, 0, 0, 0, fill="#444444", outline="#666666", width=2),
+            # Peg number
+            self.canvas.create_text(0, 0, text=str(peg_idx+1), font=("Helvetica", 12, "bold"), fill="#ffffff"),
+        )
+
+    def reset_board(self, num_pegs, num_disks):
+        """Re-bind the board to a new shape, keeping every canvas item that still fits"""
+        if self.selection_item is None:
+            self.configure(num_pegs, num_disks)
+            self.draw_board()
+            return
+        was_lod = self.layout.lod
+        self.configure(num_pegs, num_disks)
+
+        for items in self.static_items[num_pegs:]:
+            for item in items:
+                self.canvas.delete(item)
+        del self.static_items[num_pegs:]
+        for i in range(len(self.static_items), num_pegs):
+            items = self.create_peg_items(i)
+            for item in items:
+                # New pegs go underneath any disks that are already on the canvas
+                self.canvas.tag_lower(item)
+            self.static_items.append(items)
+        self.place_static_items()
+
+        stale = list(self.disk_items) if self.layout.lod != was_lod else \
+            [disk for disk in self.disk_items if disk >= num_disks]
+        for disk in stale:
+            for item in self.disk_items.pop(disk):
+                self.canvas.delete(item)
+        # Disk widths depend on the disk count, so the next sync places every disk again
+        self.disk_slots = {}
+        self.hide_selection()
+        self.hide_flash()
+        self.hide_hint()
+
+    def place_static_items(self):
+        layout = self.layout
+        for x, (peg, base, label) in zip(layout.peg_positions, self.static_items):
+            self.canvas.coords(peg, x-8, layout.peg_top, x+8, layout.base_y)
+            self.canvas.coords(base, x-20, layout.base_y, x+20, layout.base_y + 20)
+            self.canvas.coords(label, x, layout.label_y)
+
+    def disk_box(self, disk, peg_idx, level):
+        """Return the (x0, y0, x1, y1) box of a disk sitting at a peg and level"""
+        return self.layout.disk_box(disk, peg_idx, level)
+
+    def sync(self, pegs):
+        """Bring the canvas in line with pegs, touching only disks that moved"""
+        present = set()
+        for peg_idx, peg in enumerate(pegs):
+            for level, disk in enumerate(peg):
+                present.add(disk)
+                if self.disk_slots.get(disk) != (peg_idx, level):
+                    self.place_disk(disk, peg_idx, level)
+
+        # Drop items for disks that are no longer in play
+        for disk in [disk for disk in self.disk_items if disk not in present]:
+            for item in self.disk_items.pop(disk):
+                self.canvas.delete(item)
+            self.disk_slots.pop(disk, None)
+
+    def place_disk(self, disk, peg_idx, level):
+        self.set_disk_box(disk, self.disk_box(disk, peg_idx, level))
+        self.disk_slots[disk] = (peg_idx, level)
+
+    def set_disk_box(self, disk, box):
+        """Draw a disk at an arbitrary box, e.g. part way through an animation"""
+        x0, y0, x1, y1 = box
+        # The disk is off its slot until place_disk or sync puts it back
+        self.disk_slots.pop(disk, None)
+        items = self.disk_items.get(disk)
+        if items is None:
+            color = DISK_COLORS[disk % len(DISK_COLORS)]
+            if self.layout.lod:
+                # Level of detail: one thin bar per disk, no outline, highlight or number
+                self.disk_items[disk] = (self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, width=0),)
+                return
+            self.disk_items[disk] = (
+                # Draw clean 2D disk
+                self.canvas.create_rectangle(x0, y0, x1, y1, fill=color, outline="#ffffff", width=3),
+                # Simple border highlight
+                self.canvas.create_rectangle(x0 + 2, y0 + 2, x1 - 2, y1 - 2,
+                                             outline=lighten_color(color, 0.3), width=1),
+                # Disk number
+                self.canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=str(disk + 1),
+                                        font=("Helvetica", 12, "bold"), fill="#000000"),
+            )
+            return
+
+        if len(items) == 1:
+            self.canvas.coords(items[0], x0, y0, x1, y1)
+            return
+        body, highlight, label = items
+        self.canvas.coords(body, x0, y0, x1, y1)
+        self.canvas.coords(highlight, x0 + 2, y0 + 2, x1 - 2, y1 - 2)
+        self.canvas.coords(label, (x0 + x1) / 2, (y0 + y1) / 2)
+
+    def raise_disk(self, disk):
+        """Bring a disk above everything else while it travels between pegs"""
+        for item in self.disk_items[disk]:
+            self.canvas.tag_raise(item)
+
+    def show_selection(self, disk):
+        """Outline a disk with the selection overlay"""
+        self.selected_disk = disk
+        self.canvas.coords(self.selection_item, *self.disk_box(disk, *self.disk_slots[disk]))
+        self.canvas.itemconfigure(self.selection_item, state="normal")
+        self.canvas.tag_raise(self.selection_item)
+
+    def hide_selection(self):
+        self.selected_disk = None
+        self.canvas.itemconfigure(self.selection_item, state="hidden")
+
+    def show_flash(self, peg_idx):
+        """Outline a peg with the invalid-move overlay"""
+        self.canvas.coords(self.flash_item, *self.layout.peg_box(peg_idx))
+        self.canvas.itemconfigure(self.flash_item, state="normal")
+        self.canvas.tag_raise(self.flash_item)
+
+    def hide_flash(self):
+        self.canvas.itemconfigure(self.flash_item, state="hidden")
+
+    def show_hint(self, disk, to_peg):
+        """Outline the disk to move and the peg it should go to"""
+        self.hint = (disk, to_peg)
+        self.canvas.coords(self.hint_disk_item, *self.disk_box(disk, *self.disk_slots[disk]))
+        self.canvas.coords(self.hint_peg_item, *self.layout.peg_box(to_peg))
+        for item in (self.hint_disk_item, self.hint_peg_item):
+            self.canvas.itemconfigure(item, state="normal")
+            self.canvas.tag_raise(item)
+
+    def hide_hint(self):
+        self.hint = None
+        for item in (self.hint_disk_item, self.hint_peg_item):
+            self.canvas.itemconfigure(item, state="hidden")
@@ -1,9 +1,112 @@
+class MoveJournal:
+    """Undo/redo history that stores each move as one packed byte.
+
+    A move is packed as from_peg << peg_bits | to_peg, with 2 bits per peg index
+    for up to four pegs and 4 bits beyond that. A snapshot of the pegs is kept
+    every snapshot_interval moves so jump_to replays from the nearest one, and
+    the oldest history is dropped once more than max_moves are stored.
+    """
+
+    def __init__(self, num_pegs=3, snapshot_interval=256, max_moves=1 << 20):
+        self.peg_bits = 2 if num_pegs <= 4 else 4
+        self.snapshot_interval = snapshot_interval
+        self.max_moves = max(max_moves, snapshot_interval)
+        self.entries = bytearray()
+        self.offset = 0  # Move number of entries[0], grows as old history is dropped
+        self.position = 0  # Move number the game is currently at
+        self.snapshots = {}  # Move number -> pegs as a tuple of tuples
+
+    def reset(self, pegs):
+        self.entries = bytearray()
+        self.offset = 0
+        self.position = 0
+        self.snapshots = {0: tuple(tuple(peg) for peg in pegs)}
+
+    @property
+    def end(self):
+        return self.offset + len(self.entries)
+
+    def can_undo(self):
+        return self.position > self.offset
+
+    def can_redo(self):
+        return self.position < self.end
+
+    def unpack(self, entry):
+        return entry >> self.peg_bits, entry & ((1 << self.peg_bits) - 1)
+
+    def record(self, from_peg, to_peg, pegs):
+        """Append a move made at the current position, discarding any redo history"""
+        if self.position < self.end:
+            del self.entries[self.position - self.offset:]
+            for k in [k for k in self.snapshots if k > self.position]:
+                del self.snapshots[k]
+        self.entries.append(from_peg << self.peg_bits | to_peg)
+        self.position += 1
+        if self.position % self.snapshot_interval == 0:
+            self.snapshots[self.position] = tuple(tuple(peg) for peg in pegs)
+        if len(self.entries) > self.max_moves + self.snapshot_interval:
+            self.trim()
+
+    def trim(self):
+        """Drop the oldest moves, cutting at a snapshot so the new start stays restorable"""
+        excess = len(self.entries) - self.max_moves
+        cut = -(-(self.offset + excess) // self.snapshot_interval) * self.snapshot_interval
+        cut = min(cut, self.position - self.position % self.snapshot_interval)
+        del self.entries[:cut - self.offset]
+        for k in [k for k in self.snapshots if k < cut]:
+            del self.snapshots[k]
+        self.offset = cut
+
+    def undo(self):
+        """Step back one move and return it as (from_peg, to_peg), or None"""
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        return self.unpack(self.entries[self.position - self.offset])
+
+    def redo(self):
+        """Step forward one move and return it as (from_peg, to_peg), or None"""
+        if not self.can_redo():
+            return None
+        self.position += 1
+        return self.unpack(self.entries[self.position - 1 - self.offset])
+
+    def state_at(self, k):
+        """Rebuild the pegs after move k from the nearest snapshot at or before it"""
+        if not self.offset <= k <= self.end:
+            raise ValueError(f"move {k} is outside the journal ({self.offset}..{self.end})")
+        base = k - k % self.snapshot_interval
+        if base < self.offset:
+            base = self.offset
+        pegs = [list(peg) for peg in self.snapshots[base]]
+        for entry in self.entries[base - self.offset:k - self.offset]:
+            from_peg, to_peg = self.unpack(entry)
+            pegs[to_peg].append(pegs[from_peg].pop())
+        return pegs
+
+
 class GameLogic:
-    def __init__(self):
+    def __init__(self, num_pegs=3):
+        self.num_pegs = num_pegs
         self.pegs = []  # List of lists, each sublist is disks on that peg, top is last
+        self.journal = None  # Optional MoveJournal, see enable_journal
+        self.recorder = None  # Optional recording.RecordingWriter fed every move made
+
+    def initialize(self, num_disks, start_pegs=None):
+        if start_pegs is None:
+            # Largest disk at bottom of the first peg
+            self.pegs = [list(range(num_disks-1, -1, -1))] + [[] for _ in range(self.num_pegs - 1)]
+        else:
+            # Any legal layout, e.g. a puzzle_generator challenge; copied so the caller's is untouched
+            self.pegs = [list(peg) for peg in start_pegs]
+        if self.journal is not None:
+            self.journal.reset(self.pegs)
 
-    def initialize(self, num_disks):
-        self.pegs = [list(range(num_disks-1, -1, -1)), [], []]  # Largest disk at bottom
+    def enable_journal(self, snapshot_interval=256, max_moves=1 << 20):
+        """Record every move so it can be undone, redone or jumped to"""
+        self.journal = MoveJournal(self.num_pegs, snapshot_interval, max_moves)
+        self.journal.reset(self.pegs)
 
     def move_disk(self, from_peg, to_peg):
         if not self.pegs[from_peg]:
@@ -13,7 +116,131 @@ class GameLogic:
             return False  # Cannot place larger on smaller
         self.pegs[from_peg].pop()
         self.pegs[to_peg].append(disk)
+        if self.journal is not None:
+            self.journal.record(from_peg, to_peg, self.pegs)
+        if self.recorder is not None:
+            self.recorder.write_move(from_peg, to_peg)
         return True
 
+    def undo(self):
+        """Take back the last move, returning False when there is nothing to undo"""
+        move = self.journal.undo() if self.journal is not None else None
+        if move is None:
+            return False
+        from_peg, to_peg = move
+        self.pegs[from_peg].append(self.pegs[to_peg].pop())
+        if self.recorder is not None:
+            self.recorder.write_move(to_peg, from_peg)
+        return True
+
+    def redo(self):
+        """Replay the last undone move, returning False when there is nothing to redo"""
+        move = self.journal.redo() if self.journal is not None else None
+        if move is None:
+            return False
+        from_peg, to_peg = move
+        self.pegs[to_peg].append(self.pegs[from_peg].pop())
+        if self.recorder is not None:
+            self.recorder.write_move(from_peg, to_peg)
+        return True
+
+    def jump_to(self, k):
+        """Restore the position after move k of the journal, keeping later moves for redo"""
+        self.pegs = self.journal.state_at(k)
+        self.journal.position = k
+
     def is_solved(self):
-        return len(self.pegs[2]) == len(self.pegs[0]) + len(self.pegs[1]) + len(self.pegs[2]) and not self.pegs[0] and not self.pegs[1]
\ No newline at end of file
+        # Every disk is on the last peg exactly when the other pegs are empty
+        return not any(self.pegs[:-1])
+
+
+class CompactGameLogic:
+    """Bitmask-backed game state, a drop-in for GameLogic in bulk workloads"""
+
+    def __init__(self, num_pegs=3):
+        self.num_pegs = num_pegs
+        self.num_disks = 0
+        self.masks = []  # One bitmask per peg, bit d is set when disk d is on that peg
+        self.full_mask = 0
+
+    def initialize(self, num_disks, start_pegs=None):
+        if start_pegs is not None:
+            self.pegs = start_pegs
+            return
+        self.num_disks = num_disks
+        self.full_mask = (1 << num_disks) - 1
+        self.masks = [self.full_mask] + [0] * (self.num_pegs - 1)
+
+    @property
+    def pegs(self):
+        """List-of-lists view of the state, laid out like GameLogic.pegs"""
+        return [[disk for disk in range(self.num_disks - 1, -1, -1) if mask >> disk & 1]
+                for mask in self.masks]
+
+    @pegs.setter
+    def pegs(self, pegs):
+        self.num_pegs = len(pegs)
+        self.num_disks = sum(len(peg) for peg in pegs)
+        self.full_mask = (1 << self.num_disks) - 1
+        self.masks = [sum(1 << disk for disk in peg) for peg in pegs]
+
+    def top_disk(self, peg):
+        """Return the smallest disk on a peg (its top) or None when it is empty"""
+        mask = self.masks[peg]
+        if not mask:
+            return None
+        return (mask & -mask).bit_length() - 1
+
+    def move_disk(self, from_peg, to_peg):
+        source = self.masks[from_peg]
+        if not source:
+            return False  # No disk to move
+        disk_bit = source & -source  # Lowest set bit is the top disk
+        target = self.masks[to_peg]
+        if target and target & -target < disk_bit:
+            return False  # Cannot place larger on smaller
+        self.masks[from_peg] = source ^ disk_bit
+        self.masks[to_peg] = target | disk_bit
+        return True
+
+    def is_solved(self):
+        return self.masks[-1] == self.full_mask
+
+    def state_code(self):
+        """Serialize the state as one integer: digit d in base num_pegs is the peg of disk d"""
+        position = [0] * self.num_disks
+        for peg, mask in enumerate(self.masks):
+            while mask:
+                disk_bit = mask & -mask
+                position[disk_bit.bit_length() - 1] = peg
+                mask ^= disk_bit
+        code = 0
+        for peg in reversed(position):
+            code = code * self.num_pegs + peg
+        return code
+
+    @classmethod
+    def from_state_code(cls, num_disks, code, num_pegs=3):
+        """Rebuild a state serialized by state_code"""
+        game = cls(num_pegs)
+        game.initialize(num_disks)
+        game.masks = [0] * num_pegs
+        for disk in range(num_disks):
+            code, peg = divmod(code, num_pegs)
+            game.masks[peg] |= 1 << disk
+        return game
+
+    def copy(self):
+        game = CompactGameLogic(self.num_pegs)
+        game.num_disks = self.num_disks
+        game.full_mask = self.full_mask
+        game.masks = list(self.masks)
+        return game
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactGameLogic):
+            return NotImplemented
+        return self.num_disks == other.num_disks and self.masks == other.masks
+
+    def __hash__(self):
+        return hash((self.num_disks, tuple(self.masks)))
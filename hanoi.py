@@ -0,0 +1,325 @@
+"""Headless command line tools for the Tower of Hanoi engine.
+
+Run with ``python -m hanoi <command>``. Nothing here imports the UI modules,
+so it works on machines without a display or customtkinter.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from game_logic import GameLogic, CompactGameLogic
+from hanoi_solver import HanoiSolver
+from parallel_solver import DEFAULT_CHUNK_SIZE, parallel_verify, verify_chunk
+from recording import RecordingReader, RecordingWriter
+from search import DistanceTable
+
+BACKENDS = {"list": GameLogic, "compact": CompactGameLogic}
+RESULT_FIELDS = ["disks", "pegs", "backend", "moves", "solved", "wall_time", "moves_per_sec", "peak_memory"]
+
+
+def parse_disk_range(text):
+    """Parse disk counts given as "5", "1..30" or "3,5,8" into a list"""
+    sizes = []
+    for part in text.split(","):
+        if ".." in part:
+            low, high = part.split("..")
+            sizes.extend(range(int(low), int(high) + 1))
+        else:
+            sizes.append(int(part))
+    return sizes
+
+
+def reset_peak_rss():
+    """Restart peak RSS tracking from the current RSS; False where the OS has no way to"""
+    # Linux resets VmHWM when "5" is written to clear_refs; ru_maxrss never goes down
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss():
+    """Peak resident set size in bytes since the last reset_peak_rss, or None if unknown"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def simulate(num_disks, backend="list", trace_memory=False, num_pegs=3):
+    """Solve one size the way Auto Solve does, replay every move through move_disk and time it.
+
+    The result only counts as solved when it took exactly min_moves, so this
+    also checks that Auto Solve from the start is Frame-Stewart beyond three pegs.
+
+    Peak memory is how far RSS rose above its level when this size started,
+    the OS peak being reset first, so every row of a single-process run gets
+    its own figure. With trace_memory, or where the peak cannot be reset,
+    tracemalloc measures the size's Python allocations instead, which is
+    exact but slows the run.
+    """
+    trace_memory = trace_memory or not reset_peak_rss()
+    if trace_memory:
+        tracemalloc.start()
+    else:
+        baseline = peak_rss()
+    game = BACKENDS[backend](num_pegs)
+    game.initialize(num_disks)
+    solver = HanoiSolver(game)
+
+    start = time.perf_counter()
+    moves = 0
+    for from_peg, to_peg in solver.get_remaining_moves():
+        if not game.move_disk(from_peg, to_peg):
+            break
+        moves += 1
+    wall_time = time.perf_counter() - start
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    else:
+        peak = peak_rss() - baseline
+
+    return {
+        "disks": num_disks,
+        "pegs": num_pegs,
+        "backend": backend,
+        "moves": moves,
+        "solved": game.is_solved() and moves == solver.min_moves(num_disks, num_pegs),
+        "wall_time": round(wall_time, 6),
+        "moves_per_sec": round(moves / wall_time) if wall_time else 0,
+        "peak_memory": peak,
+    }
+
+
+def write_results(results, fmt, out):
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    else:
+        json.dump(results, out, indent=2)
+        out.write("\n")
+
+
+def run_simulate(args):
+    sizes = parse_disk_range(args.disks)
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(simulate, sizes, [args.backend] * len(sizes),
+                                    [args.trace_memory] * len(sizes), [args.pegs] * len(sizes)))
+    else:
+        results = [simulate(n, args.backend, args.trace_memory, args.pegs) for n in sizes]
+    write_results(results, args.format, sys.stdout)
+    return 0 if all(result["solved"] for result in results) else 1
+
+
+def run_verify(args):
+    chunk_worker = verify_chunk
+    if args.vectorized:
+        import vectorized
+        vectorized.require_numpy()
+        chunk_worker = vectorized.verify_chunk
+    start = time.perf_counter()
+    result = parallel_verify(args.disks, args.workers, args.chunk_size, args.output, chunk_worker)
+    wall_time = time.perf_counter() - start
+    result["wall_time"] = round(wall_time, 6)
+    result["moves_per_sec"] = round(result["moves"] / wall_time) if wall_time else 0
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0 if result["legal"] and result["moves"] == (1 << args.disks) - 1 else 1
+
+
+def run_record(args):
+    """Stream the optimal solution straight into a recording file"""
+    solver = HanoiSolver(None)
+    start = time.perf_counter()
+    with RecordingWriter(args.output, args.disks, args.pegs) as writer:
+        for from_peg, to_peg in solver.get_solution_moves(args.disks, args.pegs):
+            writer.write_move(from_peg, to_peg)
+        moves = writer.move_count
+    wall_time = time.perf_counter() - start
+    json.dump({"disks": args.disks, "pegs": args.pegs, "moves": moves, "output": args.output,
+               "wall_time": round(wall_time, 6)}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+def run_replay(args):
+    """Describe a recording and replay it through the game rules"""
+    with RecordingReader(args.recording) as reader:
+        game = CompactGameLogic(reader.num_pegs)
+        game.pegs = reader.start_pegs()
+        start = time.perf_counter()
+        legal_moves = 0
+        for from_peg, to_peg in reader:
+            if not game.move_disk(from_peg, to_peg):
+                break
+            legal_moves += 1
+        wall_time = time.perf_counter() - start
+        result = {
+            "disks": reader.num_disks,
+            "pegs": reader.num_pegs,
+            "moves": len(reader),
+            "timing": reader.timing,
+            "legal": legal_moves == len(reader),
+            "solved": game.is_solved(),
+            "wall_time": round(wall_time, 6),
+        }
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0 if result["legal"] else 1
+
+
+def run_distance_table(args):
+    """Precompute distances from every state to the goal and save them"""
+    start = time.perf_counter()
+    table = DistanceTable.build(args.disks, args.pegs)
+    table.save(args.output)
+    wall_time = time.perf_counter() - start
+    json.dump({"disks": args.disks, "pegs": args.pegs, "states": len(table.distances),
+               "max_distance": max(table.distances), "output": args.output,
+               "wall_time": round(wall_time, 6)}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+def run_serve(args):
+    import asyncio
+    from server import GameServer
+    print(f"Serving on {args.host}:{args.port}", file=sys.stderr)
+    try:
+        asyncio.run(GameServer(args.cache_size, args.max_sessions).serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def run_load_test(args):
+    """Drive a running server with simulated players and report sessions per second"""
+    import asyncio
+    from server import load_test
+    result = asyncio.run(load_test(args.host, args.port, args.sessions, args.concurrency, args.disks))
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+def run_puzzles(args):
+    """Generate a curated set of random-start puzzles, bucketed by difficulty tier"""
+    from puzzle_generator import default_workers, generate_puzzles
+    workers = args.workers or default_workers()
+    start = time.perf_counter()
+    tiers = generate_puzzles(args.disks, args.count, workers, args.seed, args.per_tier)
+    wall_time = time.perf_counter() - start
+    result = {
+        "disks": args.disks,
+        "generated": args.count,
+        "wall_time": round(wall_time, 6),
+        "puzzles_per_sec": round(args.count / wall_time) if wall_time else 0,
+        "tiers": {name: [{"code": code, "distance": distance} for code, distance in puzzles]
+                  for name, puzzles in tiers.items()},
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f)
+        summary = {name: len(puzzles) for name, puzzles in tiers.items()}
+        print(json.dumps({key: result[key] for key in ("disks", "generated", "wall_time", "puzzles_per_sec")}
+                         | {"tiers": summary}, indent=2))
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m hanoi", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    simulate_parser = commands.add_parser("simulate", help="solve and verify a range of sizes headlessly")
+    simulate_parser.add_argument("--disks", default="1..20", help='sizes to run, e.g. "8", "1..30" or "3,5,8"')
+    simulate_parser.add_argument("--pegs", type=int, default=3, help="number of pegs")
+    simulate_parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    simulate_parser.add_argument("--backend", choices=sorted(BACKENDS), default="list", help="game state backend")
+    simulate_parser.add_argument("--trace-memory", action="store_true",
+                                 help="measure peak Python allocations with tracemalloc instead of peak RSS (slower)")
+    simulate_parser.add_argument("--format", choices=["json", "csv"], default="json", help="output format")
+    simulate_parser.set_defaults(func=run_simulate)
+
+    verify_parser = commands.add_parser("verify", help="generate and verify one large size across processes")
+    verify_parser.add_argument("--disks", type=int, required=True, help="number of disks")
+    verify_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    verify_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="moves per work item")
+    verify_parser.add_argument("--output", help="write every move, one byte each, to this file")
+    verify_parser.add_argument("--vectorized", action="store_true", help="generate and check moves with numpy")
+    verify_parser.set_defaults(func=run_verify)
+
+    record_parser = commands.add_parser("record", help="write the optimal solution to a recording file")
+    record_parser.add_argument("--disks", type=int, required=True, help="number of disks")
+    record_parser.add_argument("--pegs", type=int, default=3, help="number of pegs")
+    record_parser.add_argument("--output", required=True, help="recording file to write")
+    record_parser.set_defaults(func=run_record)
+
+    replay_parser = commands.add_parser("replay", help="check a recording against the game rules")
+    replay_parser.add_argument("recording", help="recording file to read")
+    replay_parser.set_defaults(func=run_replay)
+
+    table_parser = commands.add_parser("distance-table", help="precompute optimal distances for every state")
+    table_parser.add_argument("--disks", type=int, required=True, help="number of disks (at most 15 on 3 pegs)")
+    table_parser.add_argument("--pegs", type=int, default=3, help="number of pegs")
+    table_parser.add_argument("--output", required=True, help="table file to write")
+    table_parser.set_defaults(func=run_distance_table)
+
+    serve_parser = commands.add_parser("serve", help="host many games over TCP, one JSON request per line")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    serve_parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    serve_parser.add_argument("--cache-size", type=int, default=1 << 16, help="shared hint cache entries")
+    serve_parser.add_argument("--max-sessions", type=int, default=100000, help="concurrent sessions allowed")
+    serve_parser.set_defaults(func=run_serve)
+
+    load_parser = commands.add_parser("load-test", help="play games against a running server")
+    load_parser.add_argument("--host", default="127.0.0.1", help="server address")
+    load_parser.add_argument("--port", type=int, default=8765, help="server port")
+    load_parser.add_argument("--sessions", type=int, default=1000, help="games to play")
+    load_parser.add_argument("--concurrency", type=int, default=100, help="games in flight at once")
+    load_parser.add_argument("--disks", type=int, default=8, help="disks per game")
+    load_parser.set_defaults(func=run_load_test)
+
+    puzzles_parser = commands.add_parser("puzzles", help="generate random-start puzzles bucketed by difficulty")
+    puzzles_parser.add_argument("--disks", type=int, required=True, help="number of disks (3 pegs)")
+    puzzles_parser.add_argument("--count", type=int, default=100000, help="puzzles to draw")
+    puzzles_parser.add_argument("--per-tier", type=int, default=None, help="keep at most this many per tier")
+    puzzles_parser.add_argument("--workers", type=int, default=None,
+                                help="worker processes (default: 1 with numpy, else all cores)")
+    puzzles_parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible set")
+    puzzles_parser.add_argument("--output", help="write the puzzles to this JSON file and print a summary")
+    puzzles_parser.set_defaults(func=run_puzzles)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,26 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def frame_stewart_table(n, num_pegs):
+    """Return (costs, splits) for 0..n disks on num_pegs pegs.
+
+    costs[m] is the Frame-Stewart move count for m disks and splits[m] is how
+    many of the top disks to park on a spare peg first. Tables are kept in a
+    bounded LRU cache per (n, num_pegs), so repeated solves cost a lookup.
+    """
+    if num_pegs == 3:
+        return tuple((1 << m) - 1 for m in range(n + 1)), tuple(max(m - 1, 0) for m in range(n + 1))
+    fewer_costs, _ = frame_stewart_table(n, num_pegs - 1)
+    costs = [0] * (n + 1)
+    splits = [0] * (n + 1)
+    for m in range(1, n + 1):
+        # Park `split` disks using every peg, move the rest without the parking
+        # peg, then bring the parked disks back on top
+        costs[m], splits[m] = min((2 * costs[split] + fewer_costs[m - split], split) for split in range(m))
+    return tuple(costs), tuple(splits)
+
+
 class HanoiSolver:
     def __init__(self, game_logic):
         self.game = game_logic
@@ -16,14 +39,135 @@ class HanoiSolver:
             moves.extend(self.solve(n-1, helper_peg, to_peg, from_peg))
             return moves
 
-    def get_solution_moves(self, num_disks):
-        """Get the complete list of moves to solve the puzzle"""
-        return self.solve(num_disks)
+    def _bitwise_pegs(self, n, from_peg, to_peg, helper_peg):
+        """Map the pegs of the bitwise move formula onto the requested pegs"""
+        # The bitwise formula moves the tower from peg 0 to peg 2 when n is odd
+        # and from peg 0 to peg 1 when n is even
+        if n % 2:
+            return (from_peg, helper_peg, to_peg)
+        return (from_peg, to_peg, helper_peg)
 
-    def get_remaining_moves(self):
-        """Get moves to solve from current game state using Tower of Hanoi rules"""
-        # For now, just return the full solution from the beginning
-        # This assumes the game starts from the initial state
-        total_disks = sum(len(peg) for peg in self.game.pegs)
-        return self.solve(total_disks)
+    def iter_moves(self, n, from_peg=0, to_peg=2, helper_peg=1):
+        """Yield the optimal moves one at a time, without recursion or a move list"""
+        return self.iter_moves_between(n, 0, (1 << n) - 1, from_peg, to_peg, helper_peg)
+
+    def iter_moves_between(self, n, start, stop, from_peg=0, to_peg=2, helper_peg=1):
+        """Yield moves start+1 through stop, taking state_at(n, start) to state_at(n, stop)"""
+        pegs = self._bitwise_pegs(n, from_peg, to_peg, helper_peg)
+        for k in range(start + 1, stop + 1):
+            yield pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3]
+
+    def move_at(self, n, k, from_peg=0, to_peg=2, helper_peg=1):
+        """Return move number k (1-based) of the optimal solution without generating the others"""
+        if not 1 <= k < (1 << n):
+            raise ValueError(f"move number must be between 1 and {(1 << n) - 1}, got {k}")
+        pegs = self._bitwise_pegs(n, from_peg, to_peg, helper_peg)
+        return pegs[(k & (k - 1)) % 3], pegs[((k | (k - 1)) + 1) % 3]
+
+    def state_at(self, n, k, from_peg=0, to_peg=2, helper_peg=1):
+        """Return the pegs layout after the first k moves of the optimal solution"""
+        if not 0 <= k < (1 << n):
+            raise ValueError(f"move count must be between 0 and {(1 << n) - 1}, got {k}")
+        pegs = [[], [], []]
+        # Walk the bits of k from the largest disk down: a clear bit means the
+        # disk is still on its source peg, a set bit means it has moved over
+        for disk in range(n - 1, -1, -1):
+            if k >> disk & 1:
+                pegs[to_peg].append(disk)
+                from_peg, helper_peg = helper_peg, from_peg
+            else:
+                pegs[from_peg].append(disk)
+                to_peg, helper_peg = helper_peg, to_peg
+        return pegs
+
+    def min_moves(self, n, num_pegs=3):
+        """Minimum number of moves for n disks, using Frame-Stewart beyond three pegs"""
+        if num_pegs == 3:
+            return (1 << n) - 1
+        return frame_stewart_table(n, num_pegs)[0][n]
 
+    def iter_frame_stewart(self, n, num_pegs, from_peg=0, to_peg=None):
+        """Yield Frame-Stewart moves for n disks on num_pegs pegs"""
+        if to_peg is None:
+            to_peg = num_pegs - 1
+        spare_pegs = tuple(peg for peg in range(num_pegs) if peg not in (from_peg, to_peg))
+        return self._iter_frame_stewart(n, from_peg, to_peg, spare_pegs)
+
+    def _iter_frame_stewart(self, n, from_peg, to_peg, spare_pegs):
+        # An explicit stack of pending transfers keeps this streaming and non-recursive
+        stack = [(n, from_peg, to_peg, spare_pegs)]
+        while stack:
+            m, source, target, spares = stack.pop()
+            if m == 0:
+                continue
+            if len(spares) == 1:
+                yield from self.iter_moves(m, source, target, spares[0])
+                continue
+            split = frame_stewart_table(n, len(spares) + 2)[1][m]
+            park = spares[0]
+            # Pushed in reverse order of execution
+            stack.append((split, park, target, (source,) + spares[1:]))
+            stack.append((m - split, source, target, spares[1:]))
+            stack.append((split, source, park, (target,) + spares[1:]))
+
+    def iter_moves_from(self, pegs, to_peg=None):
+        """Yield moves that gather any legal layout onto to_peg (the last peg by default).
+
+        With three pegs this is the shortest possible sequence. With more pegs a
+        single tower, such as the classic start, is moved as one Frame-Stewart
+        transfer of min_moves length; other layouts are solved disk by disk with
+        Frame-Stewart transfers, which is valid but not guaranteed to be minimal.
+        """
+        num_pegs = len(pegs)
+        if to_peg is None:
+            to_peg = num_pegs - 1
+        position = {}
+        for peg_idx, peg in enumerate(pegs):
+            for disk in peg:
+                position[disk] = peg_idx
+
+        # The smallest disks that already sit together as one tower on disk 0's peg
+        tower = 0
+        while tower < len(position) and position[tower] == position[0]:
+            tower += 1
+
+        # Largest disk first: the biggest disk off its target forces every smaller
+        # disk onto a helper peg, which becomes the target for the rest of them.
+        # Each such disk is recorded as (disk, from, to, helper) - at most n entries.
+        chain = []
+        transfer = None
+        target = to_peg
+        for disk in range(len(position) - 1, -1, -1):
+            if position[disk] != target:
+                if disk < tower:
+                    # Every smaller disk is stacked on this one, so they all go
+                    # across as one tower instead of one disk at a time
+                    transfer = (disk + 1, position[disk], target)
+                    break
+                others = [peg for peg in range(num_pegs) if peg != position[disk] and peg != target]
+                # With spare pegs to choose from, start where the next disk already is
+                helper = position[disk - 1] if position.get(disk - 1) in others else others[0]
+                chain.append((disk, position[disk], target, helper))
+                target = helper
+
+        if transfer is not None:
+            size, source, target = transfer
+            spare_pegs = tuple(peg for peg in range(num_pegs) if peg != source and peg != target)
+            yield from self._iter_frame_stewart(size, source, target, spare_pegs)
+
+        # The smallest misplaced disk moves first, then the tower of smaller disks
+        # it was waiting for follows it before the next disk in the chain moves
+        for disk, from_peg, target, helper in reversed(chain):
+            yield from_peg, target
+            spare_pegs = tuple(peg for peg in range(num_pegs) if peg != helper and peg != target)
+            yield from self._iter_frame_stewart(disk, helper, target, spare_pegs)
+
+    def get_solution_moves(self, num_disks, num_pegs=3):
+        """Get the moves to solve the puzzle as a lazy iterator"""
+        if num_pegs == 3:
+            return self.iter_moves(num_disks)
+        return self.iter_frame_stewart(num_disks, num_pegs)
+
+    def get_remaining_moves(self):
+        """Get the shortest moves to solve from the current game state"""
+        return self.iter_moves_from(self.game.pegs)
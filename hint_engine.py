@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from itertools import islice
+
+from hanoi_solver import HanoiSolver
+from search import state_code
+
+MISSING = object()
+
+
+class HintEngine:
+    """Optimal next-move lookups with an LRU cache keyed by the packed state.
+
+    A miss costs one largest-disk-first pass over the disks (O(n)); a hit is a
+    dictionary lookup, so replaying back and forth over the same positions is
+    effectively free.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.solver = HanoiSolver(None)
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def next_move(self, pegs, to_peg=None):
+        """Return the best next (from_peg, to_peg) towards to_peg, or None when solved"""
+        key = (len(pegs), sum(len(peg) for peg in pegs), state_code(pegs), to_peg)
+        # The first move of the streamed solution is the hint
+        return self.cached(key, lambda: next(self.solver.iter_moves_from(pegs, to_peg), None))
+
+    def next_move_compact(self, game, to_peg=None):
+        """next_move for a CompactGameLogic; the list view is only built on a miss"""
+        key = (game.num_pegs, game.num_disks, game.state_code(), to_peg)
+        return self.cached(key, lambda: next(self.solver.iter_moves_from(game.pegs, to_peg), None))
+
+    def continuation(self, pegs, limit, to_peg=None):
+        """Return up to limit optimal moves from pegs, one byte each (from_peg << 4 | to_peg).
+
+        Continuations share the LRU with hints; packing keeps an entry at one
+        byte per move, so the cache stays bounded in bytes as well as entries.
+        """
+        key = (len(pegs), sum(len(peg) for peg in pegs), state_code(pegs), to_peg, limit)
+        return self.cached(key, lambda: bytes(from_peg << 4 | to_peg for from_peg, to_peg
+                                              in islice(self.solver.iter_moves_from(pegs, to_peg), limit)))
+
+    def cached(self, key, compute):
+        value = self.cache.get(key, MISSING)
+        if value is not MISSING:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = compute()
+        self.cache[key] = value
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+        return value
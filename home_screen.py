@@ -0,0 +1,245 @@
+import customtkinter as ctk
+
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class HomeScreen:
+    def __init__(self, root, on_start_game, stats_store=None):
+        self.root = root
+        self.on_start_game = on_start_game
+        self.stats_store = stats_store
+        self.selected_disks = 3
+        self.help_window = None  # Built on first use, then shown and hidden
+
+        # Main container, packed by show()
+        self.main_frame = ctk.CTkFrame(root, fg_color="#0a0a0a")
+
+        # Title section
+        self.title_frame = ctk.CTkFrame(self.main_frame, fg_color="#1a1a1a", corner_radius=20)
+        self.title_frame.pack(fill="x", padx=30, pady=(30, 20))
+
+        self.title_label = ctk.CTkLabel(self.title_frame, text="🗼 Tower of Hanoi",
+                                      font=("Helvetica", 36, "bold"), text_color="#00ff88")
+        self.title_label.pack(pady=(25, 10))
+
+        self.subtitle_label = ctk.CTkLabel(self.title_frame, text="Classic Puzzle Game",
+                                         font=("Helvetica", 16), text_color="#cccccc")
+        self.subtitle_label.pack(pady=(0, 25))
+
+        # Game setup section
+        self.setup_frame = ctk.CTkFrame(self.main_frame, fg_color="#1a1a1a", corner_radius=20)
+        self.setup_frame.pack(fill="both", expand=True, padx=30, pady=20)
+
+        # Difficulty selection
+        self.difficulty_label = ctk.CTkLabel(self.setup_frame, text="Select Difficulty and Number of Disks",
+                                           font=("Helvetica", 20, "bold"), text_color="#ffffff")
+        self.difficulty_label.pack(pady=(30, 20))
+
+        # Disk count buttons
+        self.button_frame = ctk.CTkFrame(self.setup_frame, fg_color="transparent")
+        self.button_frame.pack(pady=20)
+
+        self.disk_buttons = []
+        difficulties = [
+            ("3", "Easy", "#4CAF50"),
+            ("4", "Medium", "#FF9800"),
+            ("5", "Hard", "#FF5722"),
+            ("6", "Expert", "#9C27B0"),
+            ("7", "Master", "#607D8B"),
+            ("8", "Legend", "#E91E63")
+        ]
+
+        for i, (num, diff, color) in enumerate(difficulties):
+            btn = ctk.CTkButton(self.button_frame, text=f"{num}\n{diff}",
+                              command=lambda n=int(num): self.select_disks(n),
+                              font=("Helvetica", 12, "bold"), fg_color=color,
+                              hover_color=self.darken_color(color, 0.2),
+                              width=80, height=60)
+            btn.grid(row=0, column=i, padx=5, pady=5)
+            self.disk_buttons.append(btn)
+
+        self.selected_disks = 3
+        self.update_button_selection()
+
+        # Tower count selection
+        self.pegs_frame = ctk.CTkFrame(self.setup_frame, fg_color="transparent")
+        self.pegs_frame.pack(pady=(0, 10))
+
+        self.pegs_label = ctk.CTkLabel(self.pegs_frame, text="Towers:", font=("Helvetica", 14, "bold"),
+                                     text_color="#ffffff")
+        self.pegs_label.pack(side="left", padx=(0, 10))
+
+        self.selected_pegs = 3
+        self.pegs_selector = ctk.CTkSegmentedButton(self.pegs_frame, values=["3", "4", "5"],
+                                                  command=self.select_pegs, font=("Helvetica", 12, "bold"),
+                                                  selected_color="#00ff88", selected_hover_color="#00cc66")
+        self.pegs_selector.set(str(self.selected_pegs))
+        self.pegs_selector.pack(side="left")
+
+        # Personal bests for the selected difficulty
+        self.best_label = ctk.CTkLabel(self.setup_frame, text="", font=("Helvetica", 13, "bold"),
+                                     text_color="#ffd700")
+        self.best_label.pack(pady=(0, 10))
+        self.update_best_label()
+
+        # Random challenge: a uniformly drawn three-tower start, picked by difficulty tier
+        self.challenge_frame = ctk.CTkFrame(self.setup_frame, fg_color="transparent")
+        self.challenge_frame.pack(pady=(10, 0))
+
+        # Same names as puzzle_generator.TIER_NAMES, which is only imported (with numpy) on demand
+        self.selected_tier = "medium"
+        self.tier_selector = ctk.CTkSegmentedButton(self.challenge_frame, values=["easy", "medium", "hard", "expert"],
+                                                  command=self.select_tier, font=("Helvetica", 12, "bold"),
+                                                  selected_color="#ff9800", selected_hover_color="#f57c00")
+        self.tier_selector.set(self.selected_tier)
+        self.tier_selector.pack(side="left", padx=(0, 10))
+
+        self.challenge_button = ctk.CTkButton(self.challenge_frame, text="🎲 Random Challenge",
+                                            command=self.start_challenge, font=("Helvetica", 14, "bold"),
+                                            fg_color="#ff9800", hover_color="#f57c00", width=180, height=40)
+        self.challenge_button.pack(side="left")
+
+        # Buttons frame
+        self.buttons_frame = ctk.CTkFrame(self.setup_frame, fg_color="transparent")
+        self.buttons_frame.pack(pady=(20, 30))
+
+        # Help button
+        self.help_button = ctk.CTkButton(self.buttons_frame, text="❓ How to Play",
+                                       command=self.show_help, font=("Helvetica", 14, "bold"),
+                                       fg_color="#2196F3", hover_color="#1976D2", width=150, height=45)
+        self.help_button.pack(side="left", padx=(0, 20))
+
+        # Start button
+        self.start_button = ctk.CTkButton(self.buttons_frame, text="🎮 Start Game",
+                                        command=self.start_game, font=("Helvetica", 14, "bold"),
+                                        fg_color="#00ff88", hover_color="#00cc66", width=150, height=45)
+        self.start_button.pack(side="left")
+
+        # Instructions
+        self.instruction_label = ctk.CTkLabel(self.main_frame,
+                                           text="Move all discs to the right tower!\nRules: Move one disc at a time, never place a larger disc on a smaller one.",
+                                           font=("Helvetica", 12), text_color="#888888")
+        self.instruction_label.pack(pady=(0, 20))
+
+    def show(self):
+        # Results may have been stored since the screen was last shown
+        self.update_best_label()
+        self.main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    def hide(self):
+        self.main_frame.pack_forget()
+
+    def darken_color(self, color, factor):
+        """Darken a hex color by factor (0-1)"""
+        r = int(color[1:3], 16)
+        g = int(color[3:5], 16)
+        b = int(color[5:7], 16)
+        r = max(0, int(r * (1 - factor)))
+        g = max(0, int(g * (1 - factor)))
+        b = max(0, int(b * (1 - factor)))
+        return f"#{r:02x}{g:02x}{b:02x}"
+
+    def select_disks(self, num_disks):
+        self.selected_disks = num_disks
+        self.update_button_selection()
+        self.update_best_label()
+
+    def select_pegs(self, value):
+        self.selected_pegs = int(value)
+        self.update_best_label()
+
+    def select_tier(self, value):
+        self.selected_tier = value
+
+    def update_best_label(self):
+        if self.stats_store is None:
+            return
+        best = self.stats_store.personal_best(self.selected_disks, self.selected_pegs)
+        if best is None or not best["wins"]:
+            self.best_label.configure(text="🏆 No wins yet at this difficulty")
+            return
+        best_time = format_seconds(best["best_seconds"])
+        median_time = format_seconds(best["median_seconds"])
+        self.best_label.configure(text=f"🏆 Best {best_time} · {best['fewest_moves']} moves · "
+                                       f"median {median_time} · {best['wins']} wins")
+
+    def update_button_selection(self):
+        difficulties = ["#4CAF50", "#FF9800", "#FF5722", "#9C27B0", "#607D8B", "#E91E63"]
+        for i, btn in enumerate(self.disk_buttons):
+            if i + 3 == self.selected_disks:
+                btn.configure(fg_color=difficulties[i])
+            else:
+                btn.configure(fg_color=self.darken_color(difficulties[i], 0.5))
+
+    def show_help(self):
+        if self.help_window is None:
+            self.build_help_window()
+        self.help_window.deiconify()
+        self.help_window.lift()
+        self.help_window.grab_set()
+
+    def hide_help(self):
+        self.help_window.grab_release()
+        self.help_window.withdraw()
+
+    def build_help_window(self):
+        help_window = ctk.CTkToplevel(self.root)
+        help_window.title("How to Play - Tower of Hanoi")
+        help_window.geometry("600x500")
+        help_window.resizable(False, False)
+        # Closing the window only hides it so it can be shown again
+        help_window.protocol("WM_DELETE_WINDOW", self.hide_help)
+
+        # Center the window
+        help_window.transient(self.root)
+
+        frame = ctk.CTkFrame(help_window, fg_color="#1a1a1a", corner_radius=15)
+        frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        title_label = ctk.CTkLabel(frame, text="🗼 How to Play Tower of Hanoi",
+                                 font=("Helvetica", 20, "bold"), text_color="#00ff88")
+        title_label.pack(pady=(20, 15))
+
+        help_text = """
+🎯 OBJECTIVE:
+Move all discs from the left tower to the right tower.
+
+📏 RULES:
+• Move only one disc at a time
+• A larger disc cannot be placed on top of a smaller disc
+• You can only move the top disc from any tower
+
+🎮 CONTROLS:
+• Click on a disc to select it
+• Click on a destination tower to move the selected disc
+• Use "Auto Solve" to see the optimal solution
+
+💡 STRATEGY:
+The minimum number of moves is 2^n - 1, where n is the number of discs.
+The solution follows a recursive pattern.
+Extra towers let you park discs and finish in far fewer moves.
+
+🎯 SCORING:
+Try to solve it in the minimum number of moves!
+        """
+
+        help_label = ctk.CTkLabel(frame, text=help_text, font=("Helvetica", 12),
+                                text_color="#ffffff", justify="left")
+        help_label.pack(pady=20, padx=20)
+
+        close_btn = ctk.CTkButton(frame, text="Got it!", command=self.hide_help,
+                                font=("Helvetica", 14, "bold"), fg_color="#00ff88",
+                                hover_color="#00cc66", width=120, height=40)
+        close_btn.pack(pady=(10, 20))
+        self.help_window = help_window
+
+    def start_game(self):
+        self.on_start_game(self.selected_disks, self.selected_pegs)
+
+    def start_challenge(self):
+        from puzzle_generator import random_puzzle
+        pegs, _ = random_puzzle(self.selected_disks, self.selected_tier)
+        self.on_start_game(self.selected_disks, 3, pegs)
@@ -0,0 +1,205 @@
+"""Opt-in profiling of the game's hot paths.
+
+Nothing in the app imports this module unless profiling is switched on with
+HANOI_PROFILE=1 or ``python main.py --profile``, and attach() wraps methods on
+live instances only, so a normal run pays nothing for it. When attached it
+records:
+
+- per-call latency histograms for rendering, input and auto-solve frames
+- solver latency where the solver really runs: hint cache misses and every
+  move the animator pulls from the lazy Auto Solve stream
+- canvas item counts after every redraw
+- peak allocation of hint cache misses and of a sample of Auto Solve moves,
+  traced around the solver's own step only
+- how late scheduler callbacks fire compared with their deadline
+
+and shows a one-line summary on the canvas, dumping everything as JSON to
+HANOI_PROFILE_FILE (default hanoi-profile.json) every few seconds.
+"""
+import functools
+import itertools
+import json
+import os
+import time
+import tracemalloc
+
+BUCKETS = 32  # Bucket i holds latencies in [2^(i-1), 2^i) microseconds
+OVERLAY_INTERVAL = 1.0
+DUMP_INTERVAL = 10.0
+DEFAULT_DUMP_PATH = "hanoi-profile.json"
+ALLOCATION_SAMPLE_EVERY = 256  # Trace one solver move in this many; tracemalloc is slow
+
+
+class Histogram:
+    """Log2-bucketed latency histogram; recording is O(1) and the size is fixed"""
+
+    def __init__(self):
+        self.buckets = [0] * BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.buckets[min(int(seconds * 1e6).bit_length(), BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """Upper edge in seconds of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        wanted = fraction * self.count
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= wanted:
+                return min((1 << i) / 1e6, self.max)
+        return self.max
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 4) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.5) * 1000, 4),
+            "p95_ms": round(self.percentile(0.95) * 1000, 4),
+            "p99_ms": round(self.percentile(0.99) * 1000, 4),
+            "max_ms": round(self.max * 1000, 4),
+            "buckets_us": {f"<{1 << i}": count for i, count in enumerate(self.buckets) if count},
+        }
+
+
+class Profiler:
+    def __init__(self, dump_path=None):
+        self.dump_path = dump_path or os.environ.get("HANOI_PROFILE_FILE", DEFAULT_DUMP_PATH)
+        self.histograms = {}
+        self.gauges = {}
+        self.started = time.time()
+        self.overlay_item = None
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def wrap(self, obj, method_name, name=None, after=None):
+        """Replace obj.method_name with a timed version on this instance only"""
+        method = getattr(obj, method_name)
+        record = self.histogram(name or f"{type(obj).__name__}.{method_name}").record
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(clock() - start)
+                if after is not None:
+                    after()
+        setattr(obj, method_name, timed)
+
+    def trace_allocation(self, name, function, *args, **kwargs):
+        """Call function, storing the peak bytes it allocated in the name and name.max gauges"""
+        gauges = self.gauges
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        try:
+            return function(*args, **kwargs)
+        finally:
+            peak = tracemalloc.get_traced_memory()[1] - base
+            gauges[name] = peak
+            gauges[f"{name}.max"] = max(peak, gauges.get(f"{name}.max", 0))
+            if started:
+                tracemalloc.stop()
+
+    def timed_moves(self, moves):
+        """Pass moves through, timing how long the solver takes to produce each one
+
+        Every ALLOCATION_SAMPLE_EVERY-th move, starting with the first, is traced
+        for allocation instead; tracing skews its latency, so it is not recorded.
+        """
+        record = self.histogram("solver.next_move").record
+        clock = time.perf_counter
+        moves = iter(moves)
+        for index in itertools.count():
+            if index % ALLOCATION_SAMPLE_EVERY == 0:
+                move = self.trace_allocation("solver.moves.peak_bytes", next, moves, None)
+            else:
+                start = clock()
+                move = next(moves, None)
+                record(clock() - start)
+            if move is None:
+                return
+            yield move
+
+    def attach(self, ui):
+        """Instrument a HanoiUI and start the overlay and the periodic dump"""
+        canvas = ui.canvas
+        gauges = self.gauges
+
+        def count_items():
+            gauges["canvas.items"] = len(canvas.find_all())
+
+        self.wrap(ui.renderer, "sync", "render.sync", after=count_items)
+        self.wrap(ui, "draw_disks", "ui.draw_disks")
+        self.wrap(ui, "on_canvas_click", "ui.on_canvas_click")
+        self.wrap(ui, "execute_moves", "ui.execute_moves")
+        self.wrap(ui, "show_hint", "ui.show_hint")
+        # Tk kept the original bound methods, so point the bindings at the wrappers
+        canvas.bind("<Button-1>", ui.on_canvas_click)
+        ui.hint_button.configure(command=ui.show_hint)
+        # The animator calls its frame through the scheduler handle, so wrap before it starts
+        self.wrap(ui.animator, "frame", "animator.frame")
+        # Solver work is lazy: it runs on hint cache misses and whenever the
+        # animator pulls the next Auto Solve move, so measure it there
+        cached = ui.hint_engine.cached
+        hint_miss = self.histogram("solver.hint_miss").record
+        clock = time.perf_counter
+
+        def compute_miss(compute):
+            start = clock()
+            try:
+                return self.trace_allocation("solver.hint_miss.peak_bytes", compute)
+            finally:
+                hint_miss(clock() - start)
+
+        ui.hint_engine.cached = lambda key, compute: cached(key, lambda: compute_miss(compute))
+        start_animation = ui.animator.start
+        ui.animator.start = lambda moves: start_animation(self.timed_moves(moves))
+        ui.scheduler.lag_hook = self.histogram("scheduler.lag").record
+
+        self.overlay_item = canvas.create_text(8, 8, anchor="nw", text="", fill="#888888",
+                                               font=("Courier", 9))
+        ui.scheduler.call_every(OVERLAY_INTERVAL, self.update_overlay, ui)
+        ui.scheduler.call_every(DUMP_INTERVAL, self.dump)
+
+    def update_overlay(self, ui):
+        frame = self.histogram("animator.frame")
+        lag = self.histogram("scheduler.lag")
+        text = (f"frame p95 {frame.percentile(0.95) * 1000:.1f}ms max {frame.max * 1000:.1f}ms | "
+                f"lag p95 {lag.percentile(0.95) * 1000:.1f}ms | "
+                f"items {self.gauges.get('canvas.items', 0)} | "
+                f"timers {ui.scheduler.pending_count}")
+        ui.canvas.itemconfigure(self.overlay_item, text=text)
+        ui.canvas.tag_raise(self.overlay_item)
+
+    def snapshot(self):
+        return {
+            "timestamp": time.time(),
+            "uptime_seconds": round(time.time() - self.started, 3),
+            "histograms": {name: histogram.as_dict() for name, histogram in sorted(self.histograms.items())},
+            "gauges": dict(sorted(self.gauges.items())),
+        }
+
+    def dump(self):
+        # Write then rename so a reader never sees a half-written file
+        partial = self.dump_path + ".tmp"
+        with open(partial, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(partial, self.dump_path)
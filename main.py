@@ -1,39 +1,108 @@
+"""Desktop entry point.
+
+Pass --profile-startup to print cold start timings and exit, or --profile
+(or set HANOI_PROFILE=1) to instrument the game screen, see instrumentation.py.
+"""
+import json
+import os
+import sys
+import time
+
+STARTUP_START = time.perf_counter()
+
+import sqlite3
+
 import customtkinter as ctk
-from ui import HanoiUI, HomeScreen
+from home_screen import HomeScreen
+from stats_store import StatsStore
+
+# Only what the home screen needs is imported up front; the game screen
+# (solver, renderer, search) is imported when the first game starts
+IMPORT_SECONDS = time.perf_counter() - STARTUP_START
+
+WINDOW_WIDTH = 900
+WINDOW_HEIGHT = 700
+
 
 class GameApp:
     def __init__(self, root):
         self.root = root
+        try:
+            self.stats_store = StatsStore()
+        except sqlite3.Error:
+            self.stats_store = None  # Play on without saving results
+        # Screens are built once and swapped with pack/pack_forget
+        self.home_screen = HomeScreen(self.root, self.start_game, self.stats_store)
+        self.game_screen = None
         self.current_screen = None
         self.show_home_screen()
 
-    def show_home_screen(self):
+    def show_screen(self, screen):
+        if self.current_screen is screen:
+            return
         if self.current_screen:
-            self.current_screen.main_frame.destroy()
-        self.current_screen = HomeScreen(self.root, self.start_game)
+            self.current_screen.hide()
+        screen.show()
+        self.current_screen = screen
+
+    def show_home_screen(self):
+        self.show_screen(self.home_screen)
+
+    def start_game(self, num_disks, num_pegs=3, start_pegs=None):
+        if self.game_screen is None:
+            from ui import HanoiUI
+            self.game_screen = HanoiUI(self.root, num_disks, self.show_home_screen, num_pegs,
+                                       self.stats_store, start_pegs)
+            if profiling_enabled():
+                from instrumentation import Profiler
+                Profiler().attach(self.game_screen)
+        else:
+            self.game_screen.configure_game(num_disks, num_pegs, start_pegs)
+        self.show_screen(self.game_screen)
+
+
+    def close(self):
+        """Store an unfinished game, close its recording and flush pending results before the window goes"""
+        if self.game_screen is not None:
+            self.game_screen.finish_game("abandoned")
+            self.game_screen.stop_recording()
+        if self.stats_store is not None:
+            self.stats_store.close()
+        self.root.destroy()
+
+
+def profiling_enabled():
+    # Checked without importing instrumentation, which stays unloaded unless asked for
+    return os.environ.get("HANOI_PROFILE", "") not in ("", "0") or "--profile" in sys.argv[1:]
+
+
+def report_startup(app):
+    """Print import and time-to-first-frame seconds as JSON, then quit"""
+    timings = {
+        "import_seconds": round(IMPORT_SECONDS, 4),
+        "first_frame_seconds": round(time.perf_counter() - STARTUP_START, 4),
+    }
+    print(json.dumps(timings))
+    app.destroy()
 
-    def start_game(self, num_disks):
-        if self.current_screen:
-            self.current_screen.main_frame.destroy()
-        self.current_screen = HanoiUI(self.root, num_disks, self.show_home_screen)
 
 if __name__ == "__main__":
-    # Modern app setup
+    # Modern app setup, applied once for every screen
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("green")
 
     app = ctk.CTk()
     app.title("🗼 Tower of Hanoi - Puzzle Game")
-    app.geometry("900x700")
     app.resizable(True, True)
 
-    # Center the window on screen
-    app.update_idletasks()
-    width = app.winfo_width()
-    height = app.winfo_height()
-    x = (app.winfo_screenwidth() // 2) - (width // 2)
-    y = (app.winfo_screenheight() // 2) - (height // 2)
-    app.geometry(f"{width}x{height}+{x}+{y}")
+    # Center the window on screen in a single geometry call
+    x = (app.winfo_screenwidth() - WINDOW_WIDTH) // 2
+    y = (app.winfo_screenheight() - WINDOW_HEIGHT) // 2
+    app.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
 
     game_app = GameApp(app)
-    app.mainloop()
\ No newline at end of file
+    app.protocol("WM_DELETE_WINDOW", game_app.close)
+    if "--profile-startup" in sys.argv[1:]:
+        # Idle callbacks run after Tk has drawn the pending first frame
+        app.after_idle(report_startup, app)
+    app.mainloop()
@@ -0,0 +1,165 @@
+import math
+import time
+
+FRAME_INTERVAL = 0.016  # Target frame interval in seconds, roughly 60 fps
+FRAME_BUDGET = 0.008  # Seconds of move processing allowed per frame
+TWEEN_LIMIT = 20  # Above this many moves per second disks jump instead of sliding
+MIN_SPEED = 0.5
+MAX_SPEED = 5000
+
+
+def speed_from_fraction(fraction):
+    """Map a 0-1 slider position onto a logarithmic moves-per-second scale"""
+    return MIN_SPEED * (MAX_SPEED / MIN_SPEED) ** fraction
+
+
+def fraction_from_speed(speed):
+    return math.log(speed / MIN_SPEED) / math.log(MAX_SPEED / MIN_SPEED)
+
+
+class MoveAnimator:
+    """Plays a stream of moves on the board at an adjustable speed.
+
+    Slow speeds tween each disk through a lift, slide and drop. Fast speeds
+    apply as many moves per frame as the speed and frame budget allow and then
+    redraw once, so the logical state runs ahead of what is on screen.
+    """
+
+    def __init__(self, scheduler, game, renderer, on_moves=None, on_done=None):
+        self.scheduler = scheduler
+        self.game = game
+        self.renderer = renderer
+        self.on_moves = on_moves  # Called with the number of moves applied
+        self.on_done = on_done
+        self.speed = 2.0  # Moves per second
+        self.moves = None
+        self.job = None
+        self.last_frame = None
+        self.credit = 0.0  # Fractional moves owed in batch mode
+        self.tween = None  # (disk, start box, end box, peg, level) of the disk in flight
+        self.progress = 0.0
+
+    def set_speed(self, moves_per_second):
+        self.speed = min(MAX_SPEED, max(MIN_SPEED, moves_per_second))
+
+    @property
+    def running(self):
+        return self.moves is not None
+
+    def start(self, moves):
+        self.stop()
+        self.moves = iter(moves)
+        self.last_frame = time.monotonic()
+        self.credit = 0.0
+        self.job = self.scheduler.call_every(FRAME_INTERVAL, self.frame)
+
+    def stop(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+        if self.tween is not None:
+            self.finish_tween()
+        self.moves = None
+
+    def frame(self):
+        now = time.monotonic()
+        elapsed = now - self.last_frame
+        self.last_frame = now
+
+        if self.speed <= TWEEN_LIMIT or self.tween is not None:
+            finished = self.step_tween(elapsed)
+        else:
+            finished = self.step_batch(elapsed)
+
+        if finished:
+            self.job.cancel()
+            self.job = None
+            self.moves = None
+            if self.on_done:
+                self.on_done()
+
+    def step_tween(self, elapsed):
+        """Advance the disk in flight, starting the next move when it lands"""
+        if self.tween is None:
+            if not self.begin_tween():
+                return True
+        else:
+            self.progress += elapsed * self.speed
+
+        if self.progress >= 1.0:
+            self.finish_tween()
+            return False
+        disk, start, end, _, _ = self.tween
+        self.renderer.set_disk_box(disk, self.tween_box(start, end, self.progress))
+        return False
+
+    def begin_tween(self):
+        for from_peg, to_peg in self.moves:
+            if not self.game.pegs[from_peg]:
+                continue
+            disk = self.game.pegs[from_peg][-1]
+            level = len(self.game.pegs[from_peg]) - 1
+            if not self.game.move_disk(from_peg, to_peg):
+                continue
+            if self.on_moves:
+                self.on_moves(1)
+            start = self.renderer.disk_box(disk, from_peg, level)
+            end_level = len(self.game.pegs[to_peg]) - 1
+            end = self.renderer.disk_box(disk, to_peg, end_level)
+            self.tween = (disk, start, end, to_peg, end_level)
+            self.progress = 0.0
+            self.renderer.raise_disk(disk)
+            return True
+        return False
+
+    def finish_tween(self):
+        disk, _, _, peg, level = self.tween
+        self.tween = None
+        self.renderer.place_disk(disk, peg, level)
+
+    def tween_box(self, start, end, t):
+        """Position along the lift, slide and drop path, each leg timed by its length"""
+        x0, y0, x1, y1 = start
+        ex0, ey0, _, _ = end
+        height = y1 - y0
+        lift_y = self.renderer.layout.lift_y
+        lift = y0 - lift_y
+        slide = abs(ex0 - x0)
+        drop = ey0 - lift_y
+        distance = (lift + slide + drop) or 1
+        travelled = t * distance
+        if travelled < lift:
+            y = y0 - travelled
+            x = x0
+        elif travelled < lift + slide:
+            y = lift_y
+            x = x0 + (travelled - lift) * (1 if ex0 >= x0 else -1)
+        else:
+            y = lift_y + (travelled - lift - slide)
+            x = ex0
+        return x, y, x + (x1 - x0), y + height
+
+    def step_batch(self, elapsed):
+        """Apply this frame's share of moves without animating them"""
+        # Cap the backlog so a slow frame does not turn into a catch-up stall
+        self.credit = min(self.credit + elapsed * self.speed, self.speed * 0.1 + 1)
+        due = int(self.credit)
+        applied = 0
+        exhausted = False
+        deadline = time.monotonic() + FRAME_BUDGET
+        while applied < due:
+            move = next(self.moves, None)
+            if move is None:
+                exhausted = True
+                break
+            if self.game.move_disk(*move):
+                applied += 1
+            # Never let a burst of moves hold up the Tk event loop
+            if not applied % 256 and time.monotonic() > deadline:
+                break
+        self.credit -= applied
+        if applied and self.on_moves:
+            self.on_moves(applied)
+        # One redraw per frame, however many moves it covered
+        self.renderer.sync(self.game.pegs)
+        return exhausted
@@ -0,0 +1,99 @@
+"""Multi-core generation and verification of optimal solutions.
+
+The optimal sequence is split into move-index ranges. Each worker rebuilds
+the state at the start of its range with HanoiSolver.state_at, replays its
+moves through GameLogic.move_disk and checks it lands on state_at for the end
+of the range, so chunks are fully independent of each other.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from game_logic import GameLogic
+from hanoi_solver import HanoiSolver
+
+DEFAULT_CHUNK_SIZE = 1 << 22
+CHECKSUM_MASK = (1 << 64) - 1
+
+
+def move_checksum(k, from_peg, to_peg):
+    """Checksum term for move k; terms are summed so any partition gives the same total"""
+    return k * (from_peg * 3 + to_peg + 1)
+
+
+def verify_chunk(num_disks, start, stop, output=None):
+    """Generate and verify moves start+1 through stop of the num_disks solution.
+
+    When output is a path the moves are written into it at byte offset start,
+    one byte per move holding from_peg << 2 | to_peg.
+    """
+    solver = HanoiSolver(None)
+    game = GameLogic()
+    game.pegs = solver.state_at(num_disks, start)
+    packed = bytearray(stop - start) if output else None
+
+    checksum = 0
+    legal = True
+    k = start
+    for from_peg, to_peg in solver.iter_moves_between(num_disks, start, stop):
+        k += 1
+        if not game.move_disk(from_peg, to_peg):
+            legal = False
+            break
+        checksum += move_checksum(k, from_peg, to_peg)
+        if packed is not None:
+            packed[k - start - 1] = from_peg << 2 | to_peg
+
+    if packed is not None:
+        with open(output, "r+b") as f:
+            f.seek(start)
+            f.write(packed)
+
+    return {
+        "start": start,
+        "stop": stop,
+        "moves": k - start,
+        "legal": legal and game.pegs == solver.state_at(num_disks, stop),
+        "checksum": checksum & CHECKSUM_MASK,
+    }
+
+
+def chunk_ranges(total_moves, chunk_size):
+    for start in range(0, total_moves, chunk_size):
+        yield start, min(start + chunk_size, total_moves)
+
+
+def parallel_verify(num_disks, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, output=None, chunk_worker=verify_chunk):
+    """Verify the whole num_disks solution across worker processes and merge the results.
+
+    chunk_worker can be swapped for vectorized.verify_chunk, which returns the same fields.
+    """
+    total_moves = (1 << num_disks) - 1
+    workers = workers or os.cpu_count() or 1
+
+    if output:
+        # Size the file up front so every worker can write its own slice
+        with open(output, "wb") as f:
+            f.truncate(total_moves)
+
+    result = {"disks": num_disks, "chunks": 0, "moves": 0, "legal": True, "checksum": 0}
+
+    def merge(chunk):
+        result["chunks"] += 1
+        result["moves"] += chunk["moves"]
+        result["legal"] = result["legal"] and chunk["legal"]
+        result["checksum"] = (result["checksum"] + chunk["checksum"]) & CHECKSUM_MASK
+
+    # Keep only a few chunks in flight per worker so 2^40-move runs do not
+    # queue hundreds of thousands of futures up front
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for start, stop in chunk_ranges(total_moves, chunk_size):
+            if len(pending) >= workers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge(future.result())
+            pending.add(pool.submit(chunk_worker, num_disks, start, stop, output))
+        for future in pending:
+            merge(future.result())
+
+    return result
@@ -0,0 +1,157 @@
+"""Random-start puzzles on three pegs, scored by their optimal distance.
+
+Every assignment of disks to pegs is a legal position (each peg's disks are
+simply stacked largest first), so drawing each disk's peg uniformly samples
+the 3^n states uniformly. A position's optimal distance to the goal peg is
+exact on three pegs: walk from the largest disk down, and every disk that
+is not on the current target costs 2^d moves and turns the third peg into
+the target for the disks above it.
+
+Puzzles are (state code, distance) pairs, the code being the base-3 integer
+of search.state_code. They are bucketed into tiers by distance as a
+fraction of the 2^n - 1 moves of the classic start. Bulk generation uses
+numpy when it is installed and worker processes otherwise.
+"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from search import decode_pegs, decode_positions, distance_to_peg
+
+GOAL_PEG = 2
+MAX_DISKS = 39  # 3^39 state codes still fit in int64
+TIERS = [("easy", 0.25), ("medium", 0.5), ("hard", 0.75), ("expert", 1.0)]  # Upper distance fraction per tier
+TIER_NAMES = [name for name, _ in TIERS]
+CHUNK_SIZE = 1 << 16
+
+
+def tier_for(distance, num_disks):
+    """Name of the tier a distance falls in for num_disks"""
+    fraction = distance / ((1 << num_disks) - 1)
+    for name, limit in TIERS:
+        if fraction <= limit:
+            return name
+    return TIERS[-1][0]
+
+
+def tier_range(tier, num_disks):
+    """Inclusive (lowest, highest) distance of a tier; the easy tier starts at 1, never solved"""
+    index = TIER_NAMES.index(tier)
+    full = (1 << num_disks) - 1
+    lowest = int(TIERS[index - 1][1] * full) + 1 if index else 1
+    return lowest, int(TIERS[index][1] * full)
+
+
+def random_puzzle(num_disks, tier=None, rng=random):
+    """Draw one unsolved puzzle, optionally from a tier, as (pegs, distance).
+
+    Tiers are reached by rejection sampling. Uniform positions are rarely
+    very easy, so a small board can take a few hundred draws for "easy".
+    Raises ValueError for a tier that has no distances on this board, such
+    as "easy" with one or two disks.
+    """
+    if tier is not None:
+        lowest, highest = tier_range(tier, num_disks)
+        if lowest > highest:
+            raise ValueError(f"no {tier} puzzles exist with {num_disks} disks")
+    while True:
+        position = [rng.randrange(3) for _ in range(num_disks)]
+        distance = distance_to_peg(position, num_disks, GOAL_PEG)
+        if distance and (tier is None or tier_for(distance, num_disks) == tier):
+            code = 0
+            for peg_idx in reversed(position):
+                code = code * 3 + peg_idx
+            return decode_pegs(code, num_disks, 3), distance
+
+
+def score_codes(num_disks, codes):
+    """Optimal distances to the goal peg for a sequence of state codes"""
+    return [distance_to_peg(decode_positions(code, num_disks, 3), num_disks, GOAL_PEG) for code in codes]
+
+
+def generate_chunk(num_disks, count, seed):
+    """Sample count puzzles; returns (codes, distances) as lists, numpy arrays when available"""
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        positions = rng.integers(0, 3, size=(count, num_disks), dtype=np.int64)
+        distances = np.zeros(count, dtype=np.int64)
+        target = np.full(count, GOAL_PEG, dtype=np.int64)
+        codes = np.zeros(count, dtype=np.int64)
+        # Largest disk first, exactly like distance_to_peg but over every puzzle at once
+        for disk in range(num_disks - 1, -1, -1):
+            peg = positions[:, disk]
+            off_target = peg != target
+            distances += off_target.astype(np.int64) << disk
+            target = np.where(off_target, 3 - peg - target, target)
+            codes = codes * 3 + peg
+        return codes, distances
+
+    rng = random.Random(seed)
+    codes = [rng.randrange(3 ** num_disks) for _ in range(count)]
+    return codes, score_codes(num_disks, codes)
+
+
+def bucket_chunk(num_disks, codes, distances):
+    """Split scored puzzles into {tier: [(code, distance), ...]}, dropping solved ones"""
+    tiers = {name: [] for name in TIER_NAMES}
+    full = (1 << num_disks) - 1
+    if np is not None and isinstance(codes, np.ndarray):
+        lower = 0
+        for name, limit in TIERS:
+            upper = int(limit * full)
+            keep = (distances > lower) & (distances <= upper)
+            tiers[name] = list(zip(codes[keep].tolist(), distances[keep].tolist()))
+            lower = upper
+        return tiers
+    for code, distance in zip(codes, distances):
+        if distance:
+            tiers[tier_for(distance, num_disks)].append((code, distance))
+    return tiers
+
+
+def generate_and_bucket(num_disks, count, seed):
+    codes, distances = generate_chunk(num_disks, count, seed)
+    return bucket_chunk(num_disks, codes, distances)
+
+
+def generate_puzzles(num_disks, count, workers=1, seed=None, per_tier=None):
+    """Generate count random puzzles and return them bucketed as {tier: [(code, distance), ...]}.
+
+    per_tier caps how many puzzles each tier keeps, which makes a curated set
+    of even size out of a larger draw. Work is split into chunks with their
+    own seeds, so a given seed gives the same puzzles for any worker count.
+    """
+    if not 1 <= num_disks <= MAX_DISKS:
+        raise ValueError(f"disks must be between 1 and {MAX_DISKS}")
+    seed = random.randrange(1 << 63) if seed is None else seed
+    chunks = [(min(CHUNK_SIZE, count - start), seed + index)
+              for index, start in enumerate(range(0, count, CHUNK_SIZE))]
+    tiers = {name: [] for name in TIER_NAMES}
+
+    def merge(chunk_tiers):
+        for name, puzzles in chunk_tiers.items():
+            tiers[name].extend(puzzles)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk_tiers in pool.map(generate_and_bucket, [num_disks] * len(chunks),
+                                        [size for size, _ in chunks], [chunk_seed for _, chunk_seed in chunks]):
+                merge(chunk_tiers)
+    else:
+        for size, chunk_seed in chunks:
+            merge(generate_and_bucket(num_disks, size, chunk_seed))
+
+    if per_tier is not None:
+        for name in tiers:
+            del tiers[name][per_tier:]
+    return tiers
+
+
+def default_workers():
+    # numpy is fast enough on one core; pure Python spreads over every core
+    return 1 if np is not None else os.cpu_count() or 1
@@ -0,0 +1,197 @@
+"""Compact binary recordings of games and solutions.
+
+A recording is a fixed header followed by fixed-size blocks of moves:
+
+    header  magic "HNRC", version, flags, disk count, peg count, moves per
+            block, total move count, then the start state as a base-k integer
+    block   moves bit-packed at 4 bits each (8 bits beyond four pegs),
+            then one uint16 millisecond delta per move when timing is on
+
+Because every block has the same size, move k lives at a computable offset,
+so the block layout doubles as the index for random access. Writers stream
+one block at a time and readers memory-map the file, so neither side ever
+holds the whole recording in memory.
+"""
+import mmap
+import struct
+import time
+from array import array
+
+from game_logic import CompactGameLogic
+
+MAGIC = b"HNRC"
+VERSION = 1
+FLAG_TIMING = 1
+HEADER = struct.Struct("<4sBBBBIQH")  # magic, version, flags, disks, pegs, block moves, move count, state bytes
+MOVE_COUNT_OFFSET = 12
+DEFAULT_BLOCK_MOVES = 4096
+MAX_DELTA_MS = 0xFFFF
+
+
+def move_bits(num_pegs):
+    return 4 if num_pegs <= 4 else 8
+
+
+def block_layout(num_pegs, block_moves, timing):
+    """Return (packed move bytes, total bytes) for one block"""
+    move_bytes = block_moves * move_bits(num_pegs) // 8
+    return move_bytes, move_bytes + (2 * block_moves if timing else 0)
+
+
+class RecordingWriter:
+    """Streams moves to a recording file one block at a time"""
+
+    def __init__(self, path, num_disks, num_pegs=3, start_pegs=None, timing=False,
+                 block_moves=DEFAULT_BLOCK_MOVES, exclusive=False):
+        if block_moves % 2:
+            raise ValueError("block_moves must be even so packed moves fill whole bytes")
+        self.num_pegs = num_pegs
+        self.timing = timing
+        self.block_moves = block_moves
+        self.bits = move_bits(num_pegs)
+        self.move_bytes, self.block_bytes = block_layout(num_pegs, block_moves, timing)
+        self.move_count = 0
+        self.moves = bytearray(self.move_bytes)
+        self.deltas = array("H", bytes(2 * block_moves)) if timing else None
+        self.last_move_time = time.monotonic()
+
+        state = CompactGameLogic(num_pegs)
+        if start_pegs is None:
+            state.initialize(num_disks)
+        else:
+            state.pegs = start_pegs
+        code = state.state_code()
+        state_bytes = code.to_bytes(max(1, (code.bit_length() + 7) // 8), "little")
+
+        # exclusive raises FileExistsError rather than truncating an earlier recording
+        self.file = open(path, "xb" if exclusive else "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, FLAG_TIMING if timing else 0, num_disks, num_pegs,
+                                    block_moves, 0, len(state_bytes)))
+        self.file.write(state_bytes)
+
+    def write_move(self, from_peg, to_peg, delta_ms=None):
+        """Append a move; with timing on, delta_ms defaults to the time since the last move"""
+        index = self.move_count % self.block_moves
+        if self.bits == 4:
+            byte = index // 2
+            shift = 4 * (index % 2)
+            self.moves[byte] = self.moves[byte] & ~(0xF << shift) | (from_peg << 2 | to_peg) << shift
+        else:
+            self.moves[index] = from_peg << 4 | to_peg
+        if self.timing:
+            now = time.monotonic()
+            if delta_ms is None:
+                delta_ms = round((now - self.last_move_time) * 1000)
+            self.last_move_time = now
+            self.deltas[index] = min(delta_ms, MAX_DELTA_MS)
+        self.move_count += 1
+        if index == self.block_moves - 1:
+            self.flush_block()
+
+    def flush_block(self):
+        self.file.write(self.moves)
+        if self.timing:
+            self.file.write(self.deltas.tobytes())
+        self.moves = bytearray(self.move_bytes)
+        if self.timing:
+            self.deltas = array("H", bytes(2 * self.block_moves))
+        # Keep the header in step with the blocks on disk, so a recording that is
+        # never closed still reads back every full block
+        self.write_move_count()
+        self.file.flush()
+
+    def write_move_count(self):
+        end = self.file.tell()
+        self.file.seek(MOVE_COUNT_OFFSET)
+        self.file.write(struct.pack("<Q", self.move_count))
+        self.file.seek(end)
+
+    def close(self):
+        if self.file.closed:
+            return
+        # A partial last block is padded so every block keeps the same size
+        if self.move_count % self.block_moves:
+            self.flush_block()
+        else:
+            self.write_move_count()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RecordingReader:
+    """Memory-mapped, random-access view of a recording"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, self.num_disks, self.num_pegs, self.block_moves, self.move_count, state_len = \
+            HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} Hanoi recording")
+        self.timing = bool(flags & FLAG_TIMING)
+        self.bits = move_bits(self.num_pegs)
+        self.move_bytes, self.block_bytes = block_layout(self.num_pegs, self.block_moves, self.timing)
+        self.state_code = int.from_bytes(self.map[HEADER.size:HEADER.size + state_len], "little")
+        self.data_offset = HEADER.size + state_len
+
+    def __len__(self):
+        return self.move_count
+
+    def start_pegs(self):
+        return CompactGameLogic.from_state_code(self.num_disks, self.state_code, self.num_pegs).pegs
+
+    def locate(self, k):
+        """Return the file offset of the block holding move k and k's index within it"""
+        if not 0 <= k < self.move_count:
+            raise IndexError(f"move {k} is outside the recording (0..{self.move_count - 1})")
+        block, index = divmod(k, self.block_moves)
+        return self.data_offset + block * self.block_bytes, index
+
+    def move_at(self, k):
+        """Return move k (0-based) as (from_peg, to_peg)"""
+        block_start, index = self.locate(k)
+        if self.bits == 4:
+            packed = self.map[block_start + index // 2] >> 4 * (index % 2) & 0xF
+            return packed >> 2, packed & 3
+        packed = self.map[block_start + index]
+        return packed >> 4, packed & 0xF
+
+    def delta_at(self, k):
+        """Milliseconds between move k and the move before it, or None without timing"""
+        if not self.timing:
+            return None
+        block_start, index = self.locate(k)
+        return struct.unpack_from("<H", self.map, block_start + self.move_bytes + 2 * index)[0]
+
+    def __iter__(self):
+        """Stream every move in order, decoding one block at a time"""
+        remaining = self.move_count
+        block_start = self.data_offset
+        while remaining > 0:
+            count = min(remaining, self.block_moves)
+            packed = self.map[block_start:block_start + self.move_bytes]
+            if self.bits == 4:
+                for index in range(count):
+                    move = packed[index // 2] >> 4 * (index % 2) & 0xF
+                    yield move >> 2, move & 3
+            else:
+                for move in packed[:count]:
+                    yield move >> 4, move & 0xF
+            remaining -= count
+            block_start += self.block_bytes
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,121 @@
+"""One Tk after() timer driving every delayed and repeating callback in the app.
+
+Callbacks sit in a heap ordered by their monotonic deadline and only the
+earliest one is armed with root.after, so the Tk loop never holds more than a
+single pending timer however many callbacks are scheduled. Repeating
+callbacks are re-armed from their previous deadline rather than from when
+they happened to run, so a one-second timer does not creep later with every
+tick.
+"""
+import heapq
+import itertools
+import time
+
+
+class Handle:
+    """A scheduled callback; cancel() stops it from running (again)"""
+
+    __slots__ = ("scheduler", "deadline", "interval", "callback", "args", "cancelled")
+
+    def __init__(self, scheduler, deadline, interval, callback, args):
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.interval = interval  # Seconds between runs, None for one-shot callbacks
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.scheduler.cancel(self)
+
+
+class Scheduler:
+    def __init__(self, root, clock=time.monotonic):
+        self.root = root
+        self.clock = clock
+        self.heap = []  # (deadline, sequence, handle); cancelled entries are dropped lazily
+        self.sequence = itertools.count()
+        self.pending_count = 0  # Live handles, repeating ones counted once
+        self.job = None
+        self.job_deadline = None
+        self.lag_hook = None  # Called with how late each callback ran, in seconds
+
+    def call_later(self, delay, callback, *args):
+        """Run callback(*args) once, delay seconds from now"""
+        return self.push(Handle(self, self.clock() + delay, None, callback, args))
+
+    def call_every(self, interval, callback, *args):
+        """Run callback(*args) every interval seconds until the handle is cancelled"""
+        return self.push(Handle(self, self.clock() + interval, interval, callback, args))
+
+    def cancel(self, handle):
+        if handle is None or handle.cancelled:
+            return
+        handle.cancelled = True
+        self.pending_count -= 1
+        # Keep dead entries from piling up when many long timers are cancelled
+        if len(self.heap) > 2 * self.pending_count + 16:
+            self.heap = [entry for entry in self.heap if not entry[2].cancelled]
+            heapq.heapify(self.heap)
+        if not self.pending_count:
+            self.disarm()
+
+    def push(self, handle):
+        heapq.heappush(self.heap, (handle.deadline, next(self.sequence), handle))
+        self.pending_count += 1
+        self.arm()
+        return handle
+
+    def arm(self):
+        """Point the single Tk timer at the earliest live deadline"""
+        while self.heap and self.heap[0][2].cancelled:
+            heapq.heappop(self.heap)
+        if not self.heap:
+            self.disarm()
+            return
+        deadline = self.heap[0][0]
+        if self.job is not None and self.job_deadline <= deadline:
+            return
+        self.disarm()
+        delay_ms = max(0, round((deadline - self.clock()) * 1000))
+        self.job = self.root.after(delay_ms, self.run_due)
+        self.job_deadline = deadline
+
+    def disarm(self):
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+            self.job_deadline = None
+
+    def run_due(self):
+        self.job = None
+        self.job_deadline = None
+        now = self.clock()
+        # A raising callback goes on to Tk's error report, but the timer is re-armed
+        # first, so the other callbacks (and later runs of a repeating one) still fire
+        try:
+            while self.heap and self.heap[0][0] <= now:
+                _, _, handle = heapq.heappop(self.heap)
+                if handle.cancelled:
+                    continue
+                if self.lag_hook is not None:
+                    self.lag_hook(now - handle.deadline)
+                if handle.interval is None:
+                    handle.cancelled = True
+                    self.pending_count -= 1
+                else:
+                    # Step from the old deadline, skipping ticks missed during a stall
+                    missed = (now - handle.deadline) // handle.interval
+                    handle.deadline += (missed + 1) * handle.interval
+                    heapq.heappush(self.heap, (handle.deadline, next(self.sequence), handle))
+                handle.callback(*handle.args)
+        finally:
+            self.arm()
+
+    def shutdown(self):
+        """Cancel everything, e.g. before the root window is destroyed"""
+        for _, _, handle in self.heap:
+            handle.cancelled = True
+        self.heap = []
+        self.pending_count = 0
+        self.disarm()
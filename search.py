@@ -0,0 +1,277 @@
+"""Shortest paths between any two legal configurations.
+
+States are encoded as base-k integers where digit d is the peg of disk d, so a
+state is a plain int and visited sets can be bit arrays indexed by state code.
+Three search tools are provided:
+
+- bidirectional_bfs for exact answers on boards whose state space fits in memory
+- astar with an admissible heuristic built on the Hanoi recursion
+- DistanceTable, a full BFS distance table that can be saved and reloaded
+"""
+import heapq
+import struct
+from array import array
+
+MAX_TABLE_STATES = 3 ** 16  # Largest state space we allocate per-state arrays for
+TABLE_MAGIC = b"HNDT"
+TABLE_HEADER = struct.Struct("<4sBBcQ")  # magic, disks, pegs, array typecode, goal code
+
+
+class BitSet:
+    """Fixed-size set of small non-negative ints backed by a bytearray"""
+
+    def __init__(self, size):
+        self.bits = bytearray((size + 7) // 8)
+
+    def add(self, i):
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def discard(self, i):
+        self.bits[i >> 3] &= ~(1 << (i & 7))
+
+    def __contains__(self, i):
+        return self.bits[i >> 3] >> (i & 7) & 1
+
+
+def state_code(pegs):
+    """Encode a pegs layout as a base-k integer, digit d being the peg of disk d"""
+    num_pegs = len(pegs)
+    position = [0] * sum(len(peg) for peg in pegs)
+    for peg_idx, peg in enumerate(pegs):
+        for disk in peg:
+            position[disk] = peg_idx
+    code = 0
+    for peg_idx in reversed(position):
+        code = code * num_pegs + peg_idx
+    return code
+
+
+def decode_positions(code, num_disks, num_pegs):
+    position = []
+    for _ in range(num_disks):
+        code, peg_idx = divmod(code, num_pegs)
+        position.append(peg_idx)
+    return position
+
+
+def decode_pegs(code, num_disks, num_pegs):
+    """Turn a state code back into a GameLogic-style pegs layout"""
+    pegs = [[] for _ in range(num_pegs)]
+    for disk, peg_idx in reversed(list(enumerate(decode_positions(code, num_disks, num_pegs)))):
+        pegs[peg_idx].append(disk)
+    return pegs
+
+
+def neighbors(code, num_disks, num_pegs, powers):
+    """Yield (next_code, from_peg, to_peg) for every legal move out of a state"""
+    tops = [None] * num_pegs
+    rest = code
+    for disk in range(num_disks):
+        rest, peg_idx = divmod(rest, num_pegs)
+        if tops[peg_idx] is None:
+            tops[peg_idx] = disk
+    for from_peg, disk in enumerate(tops):
+        if disk is None:
+            continue
+        for to_peg, other in enumerate(tops):
+            if to_peg != from_peg and (other is None or other > disk):
+                yield code + (to_peg - from_peg) * powers[disk], from_peg, to_peg
+
+
+def distance_to_peg(position, num_disks, target):
+    """Exact 3-peg distance from the first num_disks disks of position to a single peg"""
+    moves = 0
+    for disk in range(num_disks - 1, -1, -1):
+        if position[disk] != target:
+            moves += 1 << disk
+            target = 3 - position[disk] - target
+    return moves
+
+
+def heuristic(position, goal, num_pegs):
+    """Admissible lower bound on the moves from position to goal.
+
+    On three pegs: the largest disk d that differs has to move at least once.
+    Before its first move every smaller disk sits on one peg other than d's
+    start, and after its last move they all sit on one peg other than its
+    goal. Both are exact distances from the Hanoi recursion. With more pegs
+    this falls back to counting disks that are not in their goal position.
+    """
+    if num_pegs != 3:
+        return sum(1 for here, there in zip(position, goal) if here != there)
+    for disk in range(len(position) - 1, -1, -1):
+        if position[disk] != goal[disk]:
+            before = min(distance_to_peg(position, disk, peg) for peg in range(3) if peg != position[disk])
+            after = min(distance_to_peg(goal, disk, peg) for peg in range(3) if peg != goal[disk])
+            return before + 1 + after
+    return 0
+
+
+def _unpack_path(meeting, parents, num_disks, num_pegs, powers, reverse):
+    """Follow packed parent moves from meeting back to a search root"""
+    moves = []
+    code = meeting
+    while parents[code] != 0xFF:
+        from_peg, to_peg = divmod(parents[code], num_pegs)
+        # The disk that arrived at this state is the top of to_peg
+        position = decode_positions(code, num_disks, num_pegs)
+        disk = position.index(to_peg)
+        code -= (to_peg - from_peg) * powers[disk]
+        moves.append((to_peg, from_peg) if reverse else (from_peg, to_peg))
+    return moves if reverse else moves[::-1]
+
+
+def bidirectional_bfs(start_pegs, goal_pegs):
+    """Exact shortest move list between two layouts, searching from both ends.
+
+    Each side keeps one byte per state indexed by state code, holding the move
+    that reached it (0 means unseen), so memory is k^n bytes per side.
+    """
+    num_pegs = len(start_pegs)
+    num_disks = sum(len(peg) for peg in start_pegs)
+    total_states = num_pegs ** num_disks
+    if total_states > MAX_TABLE_STATES:
+        raise ValueError(f"{total_states} states is too many for bidirectional BFS, use astar")
+    powers = [num_pegs ** disk for disk in range(num_disks)]
+    start, goal = state_code(start_pegs), state_code(goal_pegs)
+    if start == goal:
+        return []
+
+    # parents[code] is from_peg * num_pegs + to_peg of the move into code, 0xFF at the root
+    forward, backward = bytearray(total_states), bytearray(total_states)
+    seen_forward, seen_backward = BitSet(total_states), BitSet(total_states)
+    forward[start] = backward[goal] = 0xFF
+    seen_forward.add(start)
+    seen_backward.add(goal)
+    frontiers = {True: [start], False: [goal]}
+
+    while frontiers[True] and frontiers[False]:
+        # Grow the smaller frontier
+        is_forward = len(frontiers[True]) <= len(frontiers[False])
+        parents, seen = (forward, seen_forward) if is_forward else (backward, seen_backward)
+        other_seen = seen_backward if is_forward else seen_forward
+        next_frontier = []
+        for code in frontiers[is_forward]:
+            for next_code, from_peg, to_peg in neighbors(code, num_disks, num_pegs, powers):
+                if next_code in seen:
+                    continue
+                seen.add(next_code)
+                parents[next_code] = from_peg * num_pegs + to_peg
+                if next_code in other_seen:
+                    return (_unpack_path(next_code, forward, num_disks, num_pegs, powers, False)
+                            + _unpack_path(next_code, backward, num_disks, num_pegs, powers, True))
+                next_frontier.append(next_code)
+        frontiers[is_forward] = next_frontier
+    return None
+
+
+def astar(start_pegs, goal_pegs):
+    """Shortest move list between two layouts using A* with the Hanoi heuristic"""
+    num_pegs = len(start_pegs)
+    num_disks = sum(len(peg) for peg in start_pegs)
+    total_states = num_pegs ** num_disks
+    powers = [num_pegs ** disk for disk in range(num_disks)]
+    start, goal = state_code(start_pegs), state_code(goal_pegs)
+    goal_position = decode_positions(goal, num_disks, num_pegs)
+
+    # Bit array of expanded states while it fits, plain ints beyond that
+    closed = BitSet(total_states) if total_states <= MAX_TABLE_STATES else set()
+    best = {start: 0}
+    parents = {start: None}
+    heap = [(heuristic(decode_positions(start, num_disks, num_pegs), goal_position, num_pegs), 0, start)]
+    while heap:
+        _, cost, code = heapq.heappop(heap)
+        if code == goal:
+            moves = []
+            while parents[code] is not None:
+                code, from_peg, to_peg = parents[code]
+                moves.append((from_peg, to_peg))
+            return moves[::-1]
+        if cost > best[code] or code in closed:
+            continue
+        closed.add(code)
+        for next_code, from_peg, to_peg in neighbors(code, num_disks, num_pegs, powers):
+            next_cost = cost + 1
+            if next_cost < best.get(next_code, total_states):
+                best[next_code] = next_cost
+                parents[next_code] = (code, from_peg, to_peg)
+                if next_code in closed:
+                    closed.discard(next_code)
+                estimate = heuristic(decode_positions(next_code, num_disks, num_pegs), goal_position, num_pegs)
+                heapq.heappush(heap, (next_cost + estimate, next_cost, next_code))
+    return None
+
+
+def shortest_path(start_pegs, goal_pegs):
+    """Shortest move list from start_pegs to goal_pegs, or None if unreachable"""
+    return astar(start_pegs, goal_pegs)
+
+
+class DistanceTable:
+    """Distance from every state to one goal state, filled by a single BFS"""
+
+    def __init__(self, num_disks, num_pegs, goal, distances):
+        self.num_disks = num_disks
+        self.num_pegs = num_pegs
+        self.goal = goal
+        self.distances = distances
+        self.powers = [num_pegs ** disk for disk in range(num_disks)]
+
+    @classmethod
+    def build(cls, num_disks, num_pegs=3, goal_pegs=None):
+        """Run a BFS out of the goal (moves are reversible) over all num_pegs ** num_disks states"""
+        total_states = num_pegs ** num_disks
+        if total_states > MAX_TABLE_STATES:
+            raise ValueError(f"{total_states} states is too many for a distance table")
+        if goal_pegs is None:
+            goal_pegs = [[] for _ in range(num_pegs - 1)] + [list(range(num_disks - 1, -1, -1))]
+        goal = state_code(goal_pegs)
+        typecode = "H" if num_disks <= 15 else "I"
+        unreached = (1 << (8 * array(typecode).itemsize)) - 1
+        distances = array(typecode, [unreached]) * total_states
+        powers = [num_pegs ** disk for disk in range(num_disks)]
+
+        seen = BitSet(total_states)
+        seen.add(goal)
+        distances[goal] = 0
+        frontier = [goal]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for code in frontier:
+                for next_code, _, _ in neighbors(code, num_disks, num_pegs, powers):
+                    if next_code not in seen:
+                        seen.add(next_code)
+                        distances[next_code] = depth
+                        next_frontier.append(next_code)
+            frontier = next_frontier
+        return cls(num_disks, num_pegs, goal, distances)
+
+    def distance(self, pegs):
+        return self.distances[state_code(pegs)]
+
+    def next_move(self, pegs):
+        """Return a move that brings pegs one step closer to the goal, or None at the goal"""
+        code = state_code(pegs)
+        remaining = self.distances[code]
+        for next_code, from_peg, to_peg in neighbors(code, self.num_disks, self.num_pegs, self.powers):
+            if self.distances[next_code] < remaining:
+                return from_peg, to_peg
+        return None
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(TABLE_HEADER.pack(TABLE_MAGIC, self.num_disks, self.num_pegs,
+                                      self.distances.typecode.encode(), self.goal))
+            self.distances.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            magic, num_disks, num_pegs, typecode, goal = TABLE_HEADER.unpack(f.read(TABLE_HEADER.size))
+            if magic != TABLE_MAGIC:
+                raise ValueError(f"{path} is not a Hanoi distance table")
+            distances = array(typecode.decode())
+            distances.fromfile(f, num_pegs ** num_disks)
+        return cls(num_disks, num_pegs, goal, distances)
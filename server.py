@@ -0,0 +1,288 @@
+"""Asyncio game server hosting many concurrent sessions in one process.
+
+Clients talk JSON lines over TCP, a local stand-in for a WebSocket gateway:
+every request is one JSON object on its own line and gets exactly one JSON
+line back, echoing the request's "id" when given.
+
+    {"op": "new", "disks": 8, "pegs": 3}          -> {"session": 1, "pegs": [...]}
+    {"op": "moves", "session": 1, "moves": [[0, 2], [0, 1]]}
+                                                  -> {"applied": 2, "invalid": null, "solved": false, ...}
+    {"op": "hint", "session": 1}                  -> {"move": [2, 1]}
+    {"op": "solve", "session": 1, "limit": 100}   -> {"moves": [[2, 1], ...]}
+    {"op": "state", "session": 1}                 -> {"pegs": [...], "moves": 2, "solved": false}
+    {"op": "close", "session": 1}                 -> {"closed": true}
+    {"op": "stats"}  or  {"op": "stats", "session": 1}
+
+Sessions are CompactGameLogic bitmasks, owned by the connection that made
+them and dropped when it disconnects. Move batches are applied in one tight
+loop up to the first illegal move. Hints and continuations come from a
+single HintEngine shared by every session, so positions that many players
+reach are solved once.
+"""
+import asyncio
+import json
+import time
+from itertools import islice
+
+from game_logic import CompactGameLogic
+from hint_engine import HintEngine
+from instrumentation import Histogram
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 1 << 16
+MAX_SESSIONS = 100000
+MAX_DISKS = 64
+MAX_BATCH = 1 << 16  # Moves accepted in one request
+MAX_CONTINUATION = 4096
+CACHED_CONTINUATION = 1024  # Longer continuations are streamed instead of cached
+LINE_LIMIT = 1 << 22  # Longest request line in bytes
+
+
+class RequestError(Exception):
+    pass
+
+
+class Session:
+    __slots__ = ("session_id", "game", "move_count", "created", "latency")
+
+    def __init__(self, session_id, game):
+        self.session_id = session_id
+        self.game = game
+        self.move_count = 0
+        self.created = time.monotonic()
+        self.latency = Histogram()
+
+
+class GameServer:
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE, max_sessions=MAX_SESSIONS):
+        self.hints = HintEngine(cache_size)
+        self.solver = self.hints.solver
+        self.max_sessions = max_sessions
+        self.sessions = {}
+        self.next_session_id = 1
+        self.sessions_created = 0
+        self.requests = 0
+        self.latency = {}  # op -> Histogram
+        self.started = time.monotonic()
+        self.server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self.handle_client, host, port, limit=LINE_LIMIT)
+        return self.server
+
+    async def serve_forever(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def handle_client(self, reader, writer):
+        owned = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                writer.write(self.handle_line(line, owned))
+                # Only wait on the socket when the client is not reading fast enough
+                if writer.transport.get_write_buffer_size() > LINE_LIMIT:
+                    await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for session_id in owned:
+                self.sessions.pop(session_id, None)
+            writer.close()
+
+    def handle_line(self, line, owned):
+        """Answer one request line with one encoded response line"""
+        start = time.perf_counter()
+        request_id = None
+        op = None
+        session = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError("request must be a JSON object")
+            request_id = request.get("id")
+            op = request.get("op")
+            handler = self.HANDLERS.get(op)
+            if handler is None:
+                raise RequestError(f"unknown op {op!r}")
+            if op == "new" or op == "stats" and "session" not in request:
+                response = handler(self, request, owned)
+            else:
+                session = self.find_session(request, owned)
+                response = handler(self, request, session)
+        except RequestError as error:
+            response = {"error": str(error)}
+        except (ValueError, TypeError) as error:
+            response = {"error": f"bad request: {error}"}
+        except Exception as error:
+            # Whatever a request does wrong, it must not take the connection and its sessions down
+            response = {"error": f"request failed: {type(error).__name__}"}
+        if request_id is not None:
+            response["id"] = request_id
+
+        self.requests += 1
+        elapsed = time.perf_counter() - start
+        histogram = self.latency.get(op)
+        if histogram is None:
+            histogram = self.latency[op] = Histogram()
+        histogram.record(elapsed)
+        if session is not None:
+            session.latency.record(elapsed)
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+    def int_field(self, request, name, default, lowest, highest):
+        """An integer request field within [lowest, highest]; floats and bools are refused"""
+        value = request.get(name, default)
+        if type(value) is not int or not lowest <= value <= highest:
+            raise RequestError(f"{name} must be an integer from {lowest} to {highest}")
+        return value
+
+    def find_session(self, request, owned):
+        session_id = request.get("session")
+        session = self.sessions.get(session_id) if session_id in owned else None
+        if session is None:
+            raise RequestError(f"no session {session_id!r} on this connection")
+        return session
+
+    def op_new(self, request, owned):
+        num_disks = self.int_field(request, "disks", 3, 1, MAX_DISKS)
+        num_pegs = self.int_field(request, "pegs", 3, 3, 16)
+        if len(self.sessions) >= self.max_sessions:
+            raise RequestError("server is full")
+        game = CompactGameLogic(num_pegs)
+        game.initialize(num_disks)
+        session = Session(self.next_session_id, game)
+        self.next_session_id += 1
+        self.sessions[session.session_id] = session
+        self.sessions_created += 1
+        owned.add(session.session_id)
+        return {"session": session.session_id, "pegs": game.pegs}
+
+    def op_moves(self, request, session):
+        moves = request.get("moves", [])
+        if not isinstance(moves, list):
+            raise RequestError("moves must be a list of [from, to] pairs")
+        if len(moves) > MAX_BATCH:
+            raise RequestError(f"at most {MAX_BATCH} moves per request")
+        game = session.game
+        num_pegs = game.num_pegs
+        move_disk = game.move_disk
+        applied = 0
+        invalid = None
+        try:
+            for from_peg, to_peg in moves:
+                if not (type(from_peg) is int and type(to_peg) is int and 0 <= from_peg < num_pegs
+                        and 0 <= to_peg < num_pegs and move_disk(from_peg, to_peg)):
+                    invalid = applied
+                    break
+                applied += 1
+        finally:
+            # A malformed pair still leaves the moves before it applied and counted
+            session.move_count += applied
+        return {"applied": applied, "invalid": invalid, "moves": session.move_count, "solved": game.is_solved()}
+
+    def target_peg(self, request, session):
+        to_peg = request.get("to")
+        if to_peg is not None and not (type(to_peg) is int and 0 <= to_peg < session.game.num_pegs):
+            raise RequestError(f"no peg {to_peg!r}")
+        return to_peg
+
+    def op_hint(self, request, session):
+        move = self.hints.next_move_compact(session.game, self.target_peg(request, session))
+        return {"move": list(move) if move else None}
+
+    def op_solve(self, request, session):
+        limit = min(self.int_field(request, "limit", MAX_CONTINUATION, 0, 1 << 62), MAX_CONTINUATION)
+        pegs = session.game.pegs
+        to_peg = self.target_peg(request, session)
+        if limit > CACHED_CONTINUATION:
+            return {"moves": [list(move) for move in islice(self.solver.iter_moves_from(pegs, to_peg), limit)]}
+        packed = self.hints.continuation(pegs, limit, to_peg)
+        return {"moves": [[move >> 4, move & 0xF] for move in packed]}
+
+    def op_state(self, request, session):
+        return {"pegs": session.game.pegs, "moves": session.move_count, "solved": session.game.is_solved()}
+
+    def op_close(self, request, session):
+        self.sessions.pop(session.session_id, None)
+        return {"closed": True}
+
+    def op_stats(self, request, target):
+        if isinstance(target, Session):
+            return {
+                "session": target.session_id,
+                "moves": target.move_count,
+                "age_seconds": round(time.monotonic() - target.created, 3),
+                "latency": target.latency.as_dict(),
+            }
+        return self.stats()
+
+    def stats(self):
+        uptime = time.monotonic() - self.started
+        return {
+            "uptime_seconds": round(uptime, 3),
+            "active_sessions": len(self.sessions),
+            "sessions_created": self.sessions_created,
+            "sessions_per_sec": round(self.sessions_created / uptime, 3) if uptime else 0.0,
+            "requests": self.requests,
+            "requests_per_sec": round(self.requests / uptime, 3) if uptime else 0.0,
+            "cache": {"size": len(self.hints.cache), "hits": self.hints.hits, "misses": self.hints.misses},
+            "latency": {str(op): histogram.as_dict() for op, histogram in self.latency.items()},
+        }
+
+    HANDLERS = {
+        "new": op_new,
+        "moves": op_moves,
+        "hint": op_hint,
+        "solve": op_solve,
+        "state": op_state,
+        "close": op_close,
+        "stats": op_stats,
+    }
+
+
+async def play_session(host, port, num_disks, batch_size):
+    """Client used by the load test: start a game and solve it with hints and batches"""
+    reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+
+    async def call(request):
+        writer.write(json.dumps(request).encode() + b"\n")
+        return json.loads(await reader.readline())
+
+    try:
+        session = (await call({"op": "new", "disks": num_disks}))["session"]
+        await call({"op": "hint", "session": session})
+        solved = False
+        while not solved:
+            moves = (await call({"op": "solve", "session": session, "limit": batch_size}))["moves"]
+            result = await call({"op": "moves", "session": session, "moves": moves})
+            if result["invalid"] is not None:
+                raise RuntimeError(f"server rejected its own solution at move {result['moves']}")
+            solved = result["solved"]
+        await call({"op": "close", "session": session})
+    finally:
+        writer.close()
+
+
+async def load_test(host, port, sessions, concurrency, num_disks, batch_size=256):
+    """Play sessions games, concurrency at a time, and return the client-side rates"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited():
+        async with semaphore:
+            await play_session(host, port, num_disks, batch_size)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited() for _ in range(sessions)))
+    wall_time = time.perf_counter() - start
+    return {
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "disks": num_disks,
+        "wall_time": round(wall_time, 6),
+        "sessions_per_sec": round(sessions / wall_time, 3),
+    }
@@ -0,0 +1,209 @@
+"""Local SQLite store of finished and abandoned games.
+
+Games are handed to record(), which only queues them; a background thread
+drains the queue and writes whatever has accumulated in one transaction, so
+the UI thread never waits on the disk. In the same transaction it folds the
+batch into per-difficulty aggregates (counts, best time, fewest moves) and a
+log-scaled histogram of winning times, so personal bests and percentiles are
+read from a handful of small rows however many games have been stored.
+"""
+import math
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".hanoi_stats.sqlite3")
+BATCH_SIZE = 512
+BUCKETS_PER_DOUBLING = 4  # Histogram resolution, about 19% per bucket
+BUCKET_BASE = 0.1  # Seconds at the bottom of bucket 0
+OUTCOMES = ("won", "auto", "abandoned")  # auto: finished by Auto Solve, never a personal best
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    disks INTEGER NOT NULL,
+    pegs INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    moves INTEGER NOT NULL,
+    min_moves INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_time ON games (disks, pegs, outcome, seconds);
+CREATE INDEX IF NOT EXISTS games_by_date ON games (disks, pegs, played_at);
+CREATE TABLE IF NOT EXISTS aggregates (
+    disks INTEGER NOT NULL,
+    pegs INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    abandoned INTEGER NOT NULL,
+    perfect INTEGER NOT NULL,
+    best_seconds REAL,
+    fewest_moves INTEGER,
+    total_win_seconds REAL NOT NULL,
+    PRIMARY KEY (disks, pegs)
+);
+CREATE TABLE IF NOT EXISTS win_times (
+    disks INTEGER NOT NULL,
+    pegs INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (disks, pegs, bucket)
+);
+"""
+
+UPSERT_AGGREGATE = """
+INSERT INTO aggregates (disks, pegs, games, wins, abandoned, perfect, best_seconds, fewest_moves, total_win_seconds)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (disks, pegs) DO UPDATE SET
+    games = games + excluded.games,
+    wins = wins + excluded.wins,
+    abandoned = abandoned + excluded.abandoned,
+    perfect = perfect + excluded.perfect,
+    best_seconds = min(coalesce(best_seconds, excluded.best_seconds), coalesce(excluded.best_seconds, best_seconds)),
+    fewest_moves = min(coalesce(fewest_moves, excluded.fewest_moves), coalesce(excluded.fewest_moves, fewest_moves)),
+    total_win_seconds = total_win_seconds + excluded.total_win_seconds
+"""
+
+UPSERT_WIN_TIME = """
+INSERT INTO win_times (disks, pegs, bucket, count) VALUES (?, ?, ?, ?)
+ON CONFLICT (disks, pegs, bucket) DO UPDATE SET count = count + excluded.count
+"""
+
+
+def time_bucket(seconds):
+    return max(0, math.floor(BUCKETS_PER_DOUBLING * math.log2(max(seconds, BUCKET_BASE) / BUCKET_BASE)))
+
+
+def bucket_upper_seconds(bucket):
+    return BUCKET_BASE * 2 ** ((bucket + 1) / BUCKETS_PER_DOUBLING)
+
+
+def connect(path):
+    connection = sqlite3.connect(path)
+    # WAL lets the UI read while the writer thread commits
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class StatsStore:
+    def __init__(self, path=None):
+        self.path = path or os.environ.get("HANOI_STATS_DB", DEFAULT_PATH)
+        self.reader = connect(self.path)
+        self.reader.executescript(SCHEMA)
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, name="stats-writer", daemon=True)
+        self.writer.start()
+
+    def record(self, disks, pegs, outcome, seconds, moves, min_moves):
+        """Queue one game for writing; returns immediately"""
+        if outcome not in OUTCOMES:
+            raise ValueError(f"outcome must be one of {OUTCOMES}, got {outcome!r}")
+        self.pending.put((time.time(), disks, pegs, outcome, float(seconds), moves, min_moves))
+
+    def flush(self):
+        """Block until every game queued so far has been committed"""
+        self.pending.join()
+
+    def close(self):
+        self.pending.put(None)
+        self.writer.join()
+        self.reader.close()
+
+    def write_loop(self):
+        connection = connect(self.path)
+        try:
+            while True:
+                batch = [self.pending.get()]
+                # Take whatever else is already waiting, so bursts share a transaction
+                while len(batch) < BATCH_SIZE:
+                    try:
+                        batch.append(self.pending.get_nowait())
+                    except queue.Empty:
+                        break
+                games = [game for game in batch if game is not None]
+                try:
+                    if games:
+                        with connection:
+                            self.write_batch(connection, games)
+                except sqlite3.Error as error:
+                    # A locked or full database loses this batch, not the writer
+                    print(f"stats: dropped {len(games)} games: {error}", file=sys.stderr)
+                finally:
+                    for _ in batch:
+                        self.pending.task_done()
+                if len(games) < len(batch):
+                    return
+        finally:
+            connection.close()
+
+    def write_batch(self, connection, games):
+        connection.executemany(
+            "INSERT INTO games (played_at, disks, pegs, outcome, seconds, moves, min_moves) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            games)
+
+        aggregates = {}
+        win_times = Counter()
+        for _, disks, pegs, outcome, seconds, moves, min_moves in games:
+            row = aggregates.get((disks, pegs))
+            if row is None:
+                row = aggregates[disks, pegs] = [disks, pegs, 0, 0, 0, 0, None, None, 0.0]
+            row[2] += 1
+            if outcome == "abandoned":
+                row[4] += 1
+            elif outcome == "won":
+                row[3] += 1
+                row[5] += moves == min_moves
+                row[6] = seconds if row[6] is None else min(row[6], seconds)
+                row[7] = moves if row[7] is None else min(row[7], moves)
+                row[8] += seconds
+                win_times[disks, pegs, time_bucket(seconds)] += 1
+        connection.executemany(UPSERT_AGGREGATE, list(aggregates.values()))
+        connection.executemany(UPSERT_WIN_TIME, [key + (count,) for key, count in win_times.items()])
+
+    def personal_best(self, disks, pegs=3):
+        """Aggregates for one difficulty as a dict, or None before its first game"""
+        row = self.reader.execute(
+            "SELECT games, wins, abandoned, perfect, best_seconds, fewest_moves, total_win_seconds "
+            "FROM aggregates WHERE disks = ? AND pegs = ?", (disks, pegs)).fetchone()
+        if row is None:
+            return None
+        games, wins, abandoned, perfect, best_seconds, fewest_moves, total_win_seconds = row
+        return {
+            "games": games,
+            "wins": wins,
+            "abandoned": abandoned,
+            "perfect": perfect,
+            "best_seconds": best_seconds,
+            "fewest_moves": fewest_moves,
+            "mean_seconds": total_win_seconds / wins if wins else None,
+            "median_seconds": self.win_time_percentile(disks, pegs, 0.5),
+        }
+
+    def win_time_percentile(self, disks, pegs, fraction):
+        """Winning time below which the given fraction of wins fall, to histogram resolution"""
+        rows = self.reader.execute("SELECT bucket, count FROM win_times WHERE disks = ? AND pegs = ? ORDER BY bucket",
+                                   (disks, pegs)).fetchall()
+        wanted = fraction * sum(count for _, count in rows)
+        seen = 0
+        for bucket, count in rows:
+            seen += count
+            if seen >= wanted:
+                return bucket_upper_seconds(bucket)
+        return None
+
+    def top_times(self, disks, pegs=3, limit=10):
+        """Fastest wins as (seconds, moves, played_at), straight off the games_by_time index"""
+        return self.reader.execute(
+            "SELECT seconds, moves, played_at FROM games WHERE disks = ? AND pegs = ? AND outcome = 'won' "
+            "ORDER BY seconds LIMIT ?", (disks, pegs, limit)).fetchall()
+
+    def recent_games(self, disks, pegs=3, limit=20):
+        return self.reader.execute(
+            "SELECT played_at, outcome, seconds, moves FROM games WHERE disks = ? AND pegs = ? "
+            "ORDER BY played_at DESC LIMIT ?", (disks, pegs, limit)).fetchall()
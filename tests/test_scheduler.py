@@ -0,0 +1,54 @@
+import pytest
+
+from scheduler import Scheduler
+
+
+class FakeRoot:
+    """Stands in for Tk: after() only records the job, run() fires the earliest one"""
+
+    def __init__(self):
+        self.jobs = {}
+        self.next_job = 0
+
+    def after(self, delay_ms, callback):
+        self.next_job += 1
+        self.jobs[self.next_job] = callback
+        return self.next_job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run(self):
+        job = min(self.jobs)
+        self.jobs.pop(job)()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_raising_callback_keeps_the_timer_armed():
+    root = FakeRoot()
+    clock = FakeClock()
+    scheduler = Scheduler(root, clock)
+    ticks = []
+
+    def broken():
+        raise OSError("profile file is not writable")
+
+    scheduler.call_every(1.0, broken)
+    scheduler.call_every(1.0, ticks.append, "tick")
+    clock.now = 1.0
+    with pytest.raises(OSError):
+        root.run()
+    assert len(root.jobs) == 1
+
+    # The callback behind the broken one is still due and runs on the next timer
+    root.run()
+    assert ticks == ["tick"]
+    assert scheduler.pending_count == 2
+    assert len(root.jobs) == 1
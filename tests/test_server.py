@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+from server import GameServer
+
+
+def call(server, owned, request):
+    line = request if isinstance(request, bytes) else json.dumps(request).encode()
+    return json.loads(server.handle_line(line, owned))
+
+
+def test_malformed_requests_get_error_responses():
+    server = GameServer()
+    owned = set()
+    session = call(server, owned, {"op": "new", "disks": 4})["session"]
+
+    bad_requests = [
+        {"op": "new", "session": session},  # Used to reach op_new with a Session as owned
+        {"op": "new", "disks": 1e999},  # Used to overflow in int()
+        {"op": "new", "disks": 4.5},
+        {"op": "new", "disks": True},
+        {"op": "new", "pegs": "3"},
+        {"op": "solve", "session": session, "limit": 1e999},
+        {"op": "moves", "session": session, "moves": 5},
+        {"op": "moves", "session": session, "moves": [[0, 1], [0]]},
+        b"[1, 2]",
+        b"{not json",
+    ]
+    for request in bad_requests:
+        response = call(server, owned, request)
+        if "session" not in response:
+            assert "error" in response, request
+
+    state = call(server, owned, {"op": "state", "session": session})
+    # The valid move before the malformed pair was applied and counted
+    assert state["moves"] == 1
+    assert state["pegs"] == [[3, 2, 1], [0], []]
+
+
+def test_connection_survives_malformed_requests():
+    async def scenario():
+        server = GameServer()
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def send(request):
+            writer.write(json.dumps(request).encode() + b"\n")
+            return json.loads(await reader.readline())
+
+        try:
+            session = (await send({"op": "new", "disks": 3}))["session"]
+            # "new" ignores a stray session field instead of crashing the connection
+            assert "session" in await send({"op": "new", "session": session})
+            assert "error" in await send({"op": "new", "disks": 1e999})
+            state = await send({"op": "state", "session": session})
+            assert state["pegs"] == [[2, 1, 0], [], []]
+            assert server.stats()["active_sessions"] == 2
+        finally:
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+
+    asyncio.run(scenario())
@@ -0,0 +1,28 @@
+import threading
+
+from stats_store import SCHEMA, StatsStore
+
+
+def flush_within(store, seconds=5):
+    flusher = threading.Thread(target=store.flush, daemon=True)
+    flusher.start()
+    flusher.join(seconds)
+    return not flusher.is_alive()
+
+
+def test_failed_batch_does_not_stop_the_writer(tmp_path, capsys):
+    store = StatsStore(str(tmp_path / "stats.sqlite3"))
+    try:
+        store.reader.execute("DROP TABLE games")
+        store.reader.commit()
+        store.record(3, 3, "won", 5.0, 7, 7)
+        assert flush_within(store)
+        assert "dropped 1 games" in capsys.readouterr().err
+        assert store.writer.is_alive()
+
+        store.reader.executescript(SCHEMA)
+        store.record(3, 3, "won", 4.0, 7, 7)
+        assert flush_within(store)
+        assert store.personal_best(3)["games"] == 1
+    finally:
+        store.close()
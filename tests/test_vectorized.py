@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import vectorized
+from parallel_solver import verify_chunk
+
+NUM_DISKS = 12
+TOTAL_MOVES = (1 << NUM_DISKS) - 1
+
+
+def corrupted(change):
+    """A move generator for verify_chunk that hands out the solution with change applied"""
+    from_pegs, to_pegs = vectorized.move_arrays(NUM_DISKS, 0, TOTAL_MOVES)
+    change(from_pegs, to_pegs)
+
+    def generate(num_disks, start, stop):
+        return from_pegs[start:stop], to_pegs[start:stop]
+    return generate
+
+
+def test_matches_pure_python_verify():
+    for start, stop in [(0, TOTAL_MOVES), (5, 1000), (1000, TOTAL_MOVES)]:
+        assert vectorized.verify_chunk(NUM_DISKS, start, stop, batch_size=256) == \
+            verify_chunk(NUM_DISKS, start, stop)
+
+
+def test_swapped_move_is_illegal():
+    def swap(from_pegs, to_pegs):
+        from_pegs[1234], to_pegs[1234] = to_pegs[1234], from_pegs[1234]
+
+    result = vectorized.verify_chunk(NUM_DISKS, 0, TOTAL_MOVES, batch_size=256, generate=corrupted(swap))
+    assert not result["legal"]
+    assert result["moves"] == 1234
+
+
+def test_move_from_wrong_peg_is_illegal():
+    def retarget(from_pegs, to_pegs):
+        from_pegs[3000] = 3 - from_pegs[3000] - to_pegs[3000]
+
+    result = vectorized.verify_chunk(NUM_DISKS, 0, TOTAL_MOVES, generate=corrupted(retarget))
+    assert not result["legal"]
+    assert result["moves"] == 3000
+
+
+def test_legal_detour_misses_the_final_state():
+    # Sending the smallest disk to the other free peg is a legal move, but the
+    # chunk no longer ends on the solution's state
+    def detour(from_pegs, to_pegs):
+        to_pegs[0] = 3 - from_pegs[0] - to_pegs[0]
+
+    result = vectorized.verify_chunk(NUM_DISKS, 0, 1, generate=corrupted(detour))
+    assert result["moves"] == 1
+    assert not result["legal"]
+
+
+def test_first_invalid_move_reports_the_index():
+    from_pegs, to_pegs = vectorized.move_arrays(NUM_DISKS, 100, 600)
+    assert vectorized.first_invalid_move(NUM_DISKS, 100, from_pegs, to_pegs) is None
+    to_pegs[250] = from_pegs[250]
+    assert vectorized.first_invalid_move(NUM_DISKS, 100, from_pegs, to_pegs) == 351
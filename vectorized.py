@@ -0,0 +1,295 @@
+"""NumPy batch generation and verification of optimal 3-peg solutions.
+
+Move k (1-based) of the optimal n-disk solution moves disk d = ctz(k), the
+number of trailing zero bits of k. Disk d has moved k >> (d+1) times before
+that, always cycling round the pegs in the same direction: forwards
+(0 -> 1 -> 2) when n - d is even and backwards (0 -> 2 -> 1) when it is odd.
+After k moves disk d has moved (k + 2^d) >> (d+1) times, which gives the
+whole board state at any k in closed form.
+
+Within an aligned block of 2^16 moves every move except the first one moves a
+disk below 16, and where that disk goes depends only on the block number mod
+3. So large sizes precompute three block tables once, and bulk generation
+becomes copying table slices plus one closed-form move per block.
+
+Verification does not trust any of that. It starts from the closed-form
+state, replays the move arrays against the game rules and checks that the
+replay lands on the closed-form state at the end. Move k must lift disk
+ctz(k), so the moves of disk d are every 2^(d+1)th move and the replay is
+a handful of strided slices per disk: O(batch) work in all, with the moves
+of disk 0 alone making up half the batch.
+
+numpy is optional; HAVE_NUMPY says whether this module can be used.
+"""
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from parallel_solver import CHECKSUM_MASK
+
+HAVE_NUMPY = np is not None
+DEFAULT_BATCH_SIZE = 1 << 20
+MAX_BATCH_SIZE = 1 << 24  # Largest batch checksum_terms sums exactly in float64
+MAX_DISKS = 63  # Move indices have to fit in uint64
+BLOCK_BITS = 16
+BLOCK_MOVES = 1 << BLOCK_BITS
+TABLE_MIN_DISKS = BLOCK_BITS + 2  # Smallest size whose first three blocks are all real moves
+
+
+def build_move_table():
+    """Canonical source and target pegs for each (moves before mod 3, parity of n - d) pair.
+
+    Disk d steps by 1 when n - d is even and by 2 when it is odd.
+    """
+    table = [[], []]
+    for before in range(3):
+        for parity in range(2):
+            step = 1 + parity
+            source = before * step % 3
+            table[0].append(source)
+            table[1].append((source + step) % 3)
+    return np.array(table, dtype=np.uint8)
+
+
+MOVE_TABLE = build_move_table() if np is not None else None
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("the vectorized solver needs numpy (pip install numpy)")
+
+
+def move_indices(start, stop):
+    """1-based indices of moves start+1 through stop as uint64"""
+    return np.arange(start + 1, stop + 1, dtype=np.uint64)
+
+
+def trailing_zeros(k):
+    """Count trailing zero bits of every (non-zero) uint64 in k"""
+    lowest = k & (np.uint64(0) - k)
+    # Powers of two convert to float64 exactly, so the exponent bits are the answer
+    return (lowest.astype(np.float64).view(np.uint64) >> np.uint64(52)) - np.uint64(1023)
+
+
+def move_table_index(num_disks, k):
+    """Return (disks, index) for the moves at indices k, index selecting a row of MOVE_TABLE.
+
+    Disk d has made k >> (d+1) moves before move k, and only that count mod 3
+    and the parity of n - d decide where it goes.
+    """
+    disks = trailing_zeros(k)
+    before = (k >> (disks + np.uint64(1))) % np.uint64(3)
+    parity = (disks + np.uint64(num_disks)) & np.uint64(1)
+    return disks, (before * np.uint64(2) + parity).astype(np.uint8)
+
+
+def peg_lookup(from_peg, to_peg, helper):
+    """Map canonical pegs (0 start, 1 helper, 2 goal) onto real ones"""
+    return np.array([from_peg, helper, to_peg], dtype=np.uint8)
+
+
+def closed_form_moves(num_disks, k, pegs):
+    """Canonical formula for the moves at indices k, mapped through the pegs lookup"""
+    _, index = move_table_index(num_disks, k)
+    return pegs[MOVE_TABLE[0][index]], pegs[MOVE_TABLE[1][index]]
+
+
+def canonical_positions(num_disks, disk, k):
+    """Canonical peg of one disk after each move count in k"""
+    moved = (k + np.uint64(1 << disk)) >> np.uint64(disk + 1)
+    step = 1 if (num_disks - disk) % 2 == 0 else 2
+    return (moved % np.uint64(3) * np.uint64(step) % np.uint64(3)).astype(np.uint8)
+
+
+def state_matrix(num_disks, k, from_peg=0, to_peg=2, helper=1):
+    """Peg of every disk after each move count in k, as a (num_disks, len(k)) uint8 array"""
+    require_numpy()
+    k = np.asarray(k, dtype=np.uint64)
+    pegs = peg_lookup(from_peg, to_peg, helper)
+    return np.stack([pegs[canonical_positions(num_disks, disk, k)] for disk in range(num_disks)])
+
+
+def split_alternate(values):
+    """Return (values[0::2], values[1::2]) of a uint8 array as contiguous arrays"""
+    paired = len(values) - len(values) % 2
+    # Each uint16 holds one even and one odd element, which beats two strided copies
+    pairs = np.ascontiguousarray(values[:paired]).view(np.uint16)
+    low = pairs.astype(np.uint8)
+    high = (pairs >> np.uint16(8)).astype(np.uint8)
+    even, odd = (low, high) if np.little_endian else (high, low)
+    if paired < len(values):
+        even = np.append(even, values[-1])
+    return even, odd
+
+
+def replay_moves(start, from_pegs, to_pegs, state):
+    """Replay moves start+1 onwards from state, a peg per disk.
+
+    Returns (offset of the first illegal move or None, state after the moves).
+    Move k has to lift disk d = ctz(k). It is legal when the replay has disk d
+    on the source peg and no smaller disk on either peg, which makes d the top
+    disk of its peg and smaller than whatever it lands on. The replay only
+    uses the moves themselves, never the formula that generated them.
+    """
+    sources = np.asarray(from_pegs, dtype=np.uint8)
+    targets = np.asarray(to_pegs, dtype=np.uint8)
+    state = np.array(state, dtype=np.uint8)
+    first_bad = None
+
+    def flag(bad, offset, spacing):
+        nonlocal first_bad
+        if bad.any():
+            candidate = offset + int(np.argmax(bad)) * spacing
+            first_bad = candidate if first_bad is None else min(first_bad, candidate)
+
+    flag(sources == targets, 0, 1)
+    # Level d holds, contiguously, the moves of disk d and of larger disks, which
+    # alternate: every larger move sits between two moves of disk d
+    offset = 0  # Batch offset of the level's first move; move j is at offset + j * 2^d
+    for disk in range(len(state)):
+        if not len(sources):
+            break
+        spacing = 1 << disk
+        even_sources, odd_sources = split_alternate(sources)
+        even_targets, odd_targets = split_alternate(targets)
+        if (start + 1 + offset) >> disk & 1:
+            own_sources, own_targets, own_offset = even_sources, even_targets, offset
+            sources, targets, offset = odd_sources, odd_targets, offset + spacing
+        else:
+            own_sources, own_targets, own_offset = odd_sources, odd_targets, offset + spacing
+            sources, targets = even_sources, even_targets
+        if len(own_sources):
+            # Each move of the disk starts where its previous move left it
+            flag(own_sources[:1] != state[disk], own_offset, 0)
+            flag(own_sources[1:] != own_targets[:-1], own_offset + 2 * spacing, 2 * spacing)
+        # A larger move finds the disk where its last move put it, or where it started
+        if own_offset < offset:
+            positions = own_targets[:len(sources)]
+        elif len(sources):
+            positions = np.concatenate((state[disk:disk + 1], own_targets[:len(sources) - 1]))
+        if len(sources):
+            flag((positions == sources) | (positions == targets), offset, 2 * spacing)
+        if len(own_targets):
+            state[disk] = own_targets[-1]
+    return first_bad, state
+
+
+def first_invalid_move(num_disks, start, from_pegs, to_pegs):
+    """Check arrays holding moves start+1 onwards; return the first bad 1-based index or None"""
+    require_numpy()
+    first_bad, _ = replay_moves(start, from_pegs, to_pegs, state_matrix(num_disks, [start])[:, 0])
+    return None if first_bad is None else start + 1 + first_bad
+
+
+@lru_cache(maxsize=16)
+def block_tables(num_disks, from_peg=0, to_peg=2, helper=1):
+    """Return (sources, targets): the moves of blocks 0, 1 and 2 as (3, BLOCK_MOVES) arrays.
+
+    Column 0 of every row is a block-boundary move that the tables do not
+    cover; move_arrays fills those in from the formula.
+    """
+    pegs = peg_lookup(from_peg, to_peg, helper)
+    k = np.arange(3 * BLOCK_MOVES, dtype=np.uint64)
+    k[0] = BLOCK_MOVES  # Move 0 does not exist; the boundary columns are never read anyway
+    sources, targets = closed_form_moves(num_disks, k, pegs)
+    return sources.reshape(3, BLOCK_MOVES), targets.reshape(3, BLOCK_MOVES)
+
+
+def block_spans(start, stop):
+    """Split moves start+1 through stop into (offset, block, index in block, count) spans"""
+    k = start + 1
+    while k <= stop:
+        block, index = divmod(k, BLOCK_MOVES)
+        count = min(stop + 1 - k, BLOCK_MOVES - index)
+        yield k - start - 1, block, index, count
+        k += count
+
+
+def boundary_indices(start, stop):
+    """Indices of the block-boundary moves among moves start+1 through stop"""
+    first = (start // BLOCK_MOVES + 1) * BLOCK_MOVES
+    return np.arange(first, stop + 1, BLOCK_MOVES, dtype=np.uint64)
+
+
+def move_arrays(num_disks, start, stop, from_peg=0, to_peg=2, helper=1):
+    """Return (from, to) uint8 arrays for moves start+1 through stop of the solution"""
+    require_numpy()
+    if num_disks > MAX_DISKS:
+        raise ValueError(f"at most {MAX_DISKS} disks are supported, got {num_disks}")
+    pegs = peg_lookup(from_peg, to_peg, helper)
+    if num_disks < TABLE_MIN_DISKS or stop - start < BLOCK_MOVES:
+        return closed_form_moves(num_disks, move_indices(start, stop), pegs)
+
+    sources, targets = block_tables(num_disks, from_peg, to_peg, helper)
+    from_pegs = np.empty(stop - start, dtype=np.uint8)
+    to_pegs = np.empty(stop - start, dtype=np.uint8)
+    for offset, block, index, count in block_spans(start, stop):
+        from_pegs[offset:offset + count] = sources[block % 3, index:index + count]
+        to_pegs[offset:offset + count] = targets[block % 3, index:index + count]
+    # Boundary moves shift a disk of BLOCK_BITS or more, so they come from the formula
+    boundaries = boundary_indices(start, stop)
+    offsets = (boundaries - np.uint64(start + 1)).astype(np.int64)
+    from_pegs[offsets], to_pegs[offsets] = closed_form_moves(num_disks, boundaries, pegs)
+    return from_pegs, to_pegs
+
+
+def iter_move_batches(num_disks, batch_size=DEFAULT_BATCH_SIZE, start=0, stop=None, **pegs):
+    """Yield (from, to) array pairs covering moves start+1 through stop in batches"""
+    if stop is None:
+        stop = (1 << num_disks) - 1
+    for batch_start in range(start, stop, batch_size):
+        yield move_arrays(num_disks, batch_start, min(batch_start + batch_size, stop), **pegs)
+
+
+def checksum_terms(start, from_pegs, to_pegs):
+    """Sum of parallel_solver.move_checksum over moves start+1 onwards, mod 2^64"""
+    codes = (from_pegs * np.uint8(3) + to_pegs + np.uint8(1)).astype(np.float64)
+    # sum(k * code) splits into (start+1) * sum(code) plus sum(offset * code). Both
+    # stay below 2^53 up to MAX_BATCH_SIZE moves, so float64 dot products are exact
+    weighted = np.dot(offset_weights(len(codes)), codes)
+    return ((start + 1) * int(codes.sum()) + int(weighted)) & CHECKSUM_MASK
+
+
+@lru_cache(maxsize=4)
+def offset_weights(count):
+    return np.arange(count, dtype=np.float64)
+
+
+def verify_chunk(num_disks, start, stop, output=None, batch_size=DEFAULT_BATCH_SIZE, generate=move_arrays):
+    """Vectorized counterpart of parallel_solver.verify_chunk with the same result fields.
+
+    The moves from generate(num_disks, batch_start, batch_stop) are replayed
+    from the closed-form state at start, a batch at a time, so an invalid
+    sequence is caught at the move where it breaks, and the replay has to end
+    on the closed-form state at stop.
+    """
+    require_numpy()
+    batch_size = min(batch_size, MAX_BATCH_SIZE)
+    checksum = 0
+    legal = True
+    moves = 0
+    state = state_matrix(num_disks, [start])[:, 0]
+    for batch_start in range(start, stop, batch_size):
+        batch_stop = min(batch_start + batch_size, stop)
+        from_pegs, to_pegs = generate(num_disks, batch_start, batch_stop)
+        first_bad, state = replay_moves(batch_start, from_pegs, to_pegs, state)
+        if first_bad is not None:
+            legal = False
+            moves += first_bad
+            break
+        moves += batch_stop - batch_start
+        checksum = (checksum + checksum_terms(batch_start, from_pegs, to_pegs)) & CHECKSUM_MASK
+        if output:
+            write_moves(output, batch_start, from_pegs, to_pegs)
+    legal = legal and bool((state == state_matrix(num_disks, [stop])[:, 0]).all())
+    return {"start": start, "stop": stop, "moves": moves, "legal": legal, "checksum": checksum}
+
+
+def write_moves(output, start, from_pegs, to_pegs):
+    """Write moves at byte offset start, one byte each holding from_peg << 2 | to_peg"""
+    with open(output, "r+b") as f:
+        f.seek(start)
+        f.write((from_pegs << 2 | to_pegs).tobytes())